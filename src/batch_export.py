@@ -0,0 +1,225 @@
+import os
+import json
+import importlib.util
+import multiprocessing
+
+# 离线批量导出：把单词本逐条渲染成图片序列（PNG）或原始帧流（RGBA）
+# 渲染使用 offscreen 平台上的 QImage/QPainter，标签的位置和字体由主窗口的布局函数 gui.create_word_labels 计算，
+# 与 WordScrollerWindow 一致
+
+CHUNK_SIZE = 64  # 每个任务渲染的词条数
+PROGRESS_FILE = ".export_progress.json"
+RAW_FILE = "frames.rgba"
+
+_app = None  # 子进程中的 QApplication
+_render_settings = None
+_label_layout = None  # [(单词标签位置, 字体, 文字颜色), ...]
+
+def get_render_settings(config):
+    """从配置中读取渲染所需的字体、颜色和窗口大小"""
+    return {
+        "width": config.get("app", "window_width", 800),
+        "height": config.get("app", "window_height", 120),
+        "font_size": config.get("app", "default_font_size", 22),
+        "background_color": config.get("main_window", "background_color", "black"),
+    }
+
+def fade_opacities(fade_frames):
+    """一次切换的过渡帧透明度：前一半淡出上一个单词，后一半淡入下一个单词"""
+    fade_out = fade_frames // 2
+    fade_in = fade_frames - fade_out
+    frames = [(True, 1.0 - (i + 1) / (fade_out + 1)) for i in range(fade_out)]
+    frames += [(False, (i + 1) / (fade_in + 1)) for i in range(fade_in)]
+    return frames
+
+def _init_worker(settings):
+    """子进程初始化：使用 offscreen 平台创建 QApplication，并计算标签布局"""
+    global _app, _render_settings, _label_layout
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+    _render_settings = settings
+    _label_layout = measure_label_layout(settings)
+
+def measure_label_layout(settings):
+    """按窗口大小布置与主窗口相同的标签，返回 [(单词标签位置, 字体, 文字颜色), (释义标签位置, 字体, 文字颜色)]"""
+    from PySide6.QtCore import QRect
+    from PySide6.QtGui import QFont
+    from PySide6.QtWidgets import QWidget
+    from gui import create_word_labels, apply_label_font
+    widget = QWidget()
+    layout, word_label, meaning_label = create_word_labels(widget)
+    apply_label_font(word_label, meaning_label, settings["font_size"])
+    widget.resize(settings["width"], settings["height"])
+    layout.activate()
+    result = []
+    for label in (word_label, meaning_label):
+        label.ensurePolished()  # 应用样式表中的字号
+        result.append((QRect(label.geometry()), QFont(label.font()), label.palette().windowText().color()))
+    widget.deleteLater()
+    return result
+
+def render_frame(word, meaning, opacity, settings, label_layout):
+    """渲染一帧，返回 QImage"""
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QColor, QImage, QPainter
+    image = QImage(settings["width"], settings["height"], QImage.Format.Format_RGBA8888)
+    image.fill(QColor(settings["background_color"]))
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setOpacity(opacity)
+    for text, (rect, font, color) in zip((word, meaning), label_layout):
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    return image
+
+def render_entry_frames(previous, entry, fade_frames, settings, label_layout):
+    """渲染一个词条的所有帧：过渡帧 + 停留帧"""
+    frames = []
+    for is_fade_out, opacity in fade_opacities(fade_frames):
+        word, meaning = previous if is_fade_out else entry
+        frames.append(render_frame(word, meaning, opacity, settings, label_layout))
+    frames.append(render_frame(entry[0], entry[1], 1.0, settings, label_layout))
+    return frames
+
+def frame_path(output_dir, frame_number):
+    return os.path.join(output_dir, f"frame_{frame_number:07d}.png")
+
+def _render_chunk(task):
+    """渲染一组词条。PNG 模式直接写文件，原始帧模式返回帧数据"""
+    chunk_id, first_index, previous, entries, fade_frames, output_dir, raw = task
+    frames_per_entry = fade_frames + 1
+    data = []
+    for offset, entry in enumerate(entries):
+        frames = render_entry_frames(previous, entry, fade_frames, _render_settings, _label_layout)
+        previous = entry
+        for k, image in enumerate(frames):
+            if raw:
+                data.append(bytes(image.constBits()))
+            else:
+                image.save(frame_path(output_dir, (first_index + offset) * frames_per_entry + k), "PNG")
+    return chunk_id, b"".join(data) if raw else None
+
+class BatchExporter:
+    """单词本批量导出"""
+
+    def __init__(self, entries, output_dir, settings, fade_frames=0, raw=False, workers=None, source_path=None):
+        self.entries = entries
+        self.source = None  # 单词本的路径、修改时间和大小，单词本改动后不能接着旧的进度继续
+        if source_path is not None:
+            stat = os.stat(source_path)
+            self.source = {"path": os.path.abspath(source_path), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        self.output_dir = output_dir
+        self.settings = settings
+        self.fade_frames = fade_frames
+        self.raw = raw
+        self.workers = workers or os.cpu_count() or 1
+        self.progress_path = os.path.join(output_dir, PROGRESS_FILE)
+
+    def _job_key(self):
+        """导出参数，参数不同时不能接着上次的进度继续"""
+        return {"source": self.source, "entries": len(self.entries), "fade_frames": self.fade_frames,
+                "raw": self.raw, "settings": self.settings}
+
+    def load_progress(self):
+        try:
+            with open(self.progress_path, 'r', encoding='utf-8') as f:
+                progress = json.load(f)
+            if progress.get("job") == self._job_key():
+                return set(progress.get("done", []))
+        except (OSError, ValueError):
+            pass
+        return set()
+
+    def save_progress(self, done):
+        tmp_path = self.progress_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"job": self._job_key(), "done": sorted(done)}, f)
+        os.replace(tmp_path, self.progress_path)
+
+    def make_tasks(self, done):
+        tasks = []
+        blank = ("", "")
+        for chunk_id, start in enumerate(range(0, len(self.entries), CHUNK_SIZE)):
+            if chunk_id in done:
+                continue
+            previous = self.entries[start - 1] if start > 0 else blank
+            tasks.append((chunk_id, start, previous, self.entries[start:start + CHUNK_SIZE],
+                          self.fade_frames, self.output_dir, self.raw))
+        return tasks
+
+    def run(self, progress_callback=None):
+        """开始导出，中断后再次运行会从上次完成的位置继续"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        done = self.load_progress()
+        raw_path = os.path.join(self.output_dir, RAW_FILE)
+        frame_bytes = self.settings["width"] * self.settings["height"] * 4
+        chunk_bytes = CHUNK_SIZE * (self.fade_frames + 1) * frame_bytes
+        if self.raw:
+            # 原始帧按顺序追加写入，只保留连续完成的部分
+            contiguous = 0
+            while contiguous in done:
+                contiguous += 1
+            done = set(range(contiguous))
+            raw_file = open(raw_path, 'r+b' if os.path.exists(raw_path) else 'wb')
+            raw_file.truncate(min(contiguous * chunk_bytes,
+                                  len(self.entries) * (self.fade_frames + 1) * frame_bytes))
+            raw_file.seek(0, os.SEEK_END)
+        tasks = self.make_tasks(done)
+        total = len(self.entries)
+        finished = sum(min(CHUNK_SIZE, total - chunk_id * CHUNK_SIZE) for chunk_id in done)
+        if progress_callback:
+            progress_callback(finished, total)
+        try:
+            with multiprocessing.Pool(self.workers, _init_worker, (self.settings,)) as pool:
+                # 原始帧必须按顺序写入，PNG 可以按完成顺序记录
+                results = pool.imap(_render_chunk, tasks) if self.raw else pool.imap_unordered(_render_chunk, tasks)
+                for chunk_id, data in results:
+                    if self.raw:
+                        raw_file.write(data)
+                        raw_file.flush()
+                    done.add(chunk_id)
+                    self.save_progress(done)
+                    finished += min(CHUNK_SIZE, total - chunk_id * CHUNK_SIZE)
+                    if progress_callback:
+                        progress_callback(finished, total)
+        finally:
+            if self.raw:
+                raw_file.close()
+        return True
+
+def print_progress(finished, total):
+    print(f"Exported {finished}/{total} entries")
+
+def export_books(word_manager, config, output_dir, book=None, fade_frames=0, raw=False, workers=None):
+    """导出单词本。未指定 book 时导出 resources 目录下的所有单词本，每本一个子目录"""
+    # 子进程初始化失败时进程池会不断重建子进程，所以先检查依赖
+    if importlib.util.find_spec("PySide6") is None:
+        print("Error: batch export requires PySide6")
+        return False
+    settings = get_render_settings(config)
+    files = word_manager.list_vocabulary_files()
+    library = word_manager.library
+    names = [library.get_name(i) for i in range(len(files))]
+    selected = range(len(files))
+    if book is not None:
+        # 按相对词库目录的路径匹配；只给出文件名时要求唯一，子目录中的同名单词本需写出相对路径
+        selected = [i for i, name in enumerate(names) if name == book]
+        if not selected:
+            selected = [i for i, path in enumerate(files) if os.path.basename(path) == book]
+        if not selected:
+            print(f"Error: word book {book} not found")
+            return False
+        if len(selected) > 1:
+            print(f"Error: word book {book} is ambiguous: {', '.join(names[i] for i in selected)}")
+            return False
+    for i in selected:
+        file_path = files[i]
+        # 每本一个子目录，按相对路径命名，子目录中的同名单词本不会写到同一个目录
+        book_dir = output_dir if book is not None else os.path.join(output_dir, os.path.splitext(names[i])[0])
+        entries = word_manager.read_book(file_path)
+        print(f"Exporting {names[i]} ({len(entries)} words) to {book_dir}")
+        BatchExporter(entries, book_dir, settings, fade_frames, raw, workers, file_path).run(print_progress)
+    return True
@@ -0,0 +1,77 @@
+import os
+import sys
+from collections import OrderedDict
+
+# 已解析单词本的 LRU 缓存：按路径缓存，修改时间或大小变化后失效，
+# 总占用超过上限时淘汰最久未使用的单词本
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+def entry_bytes(entry):
+    """一个 (word, meaning) 元组及其字符串占用的字节数"""
+    return sys.getsizeof(entry) + sys.getsizeof(entry[0]) + sys.getsizeof(entry[1])
+
+def entries_bytes(entries):
+    return sys.getsizeof(entries) + sum(entry_bytes(entry) for entry in entries)
+
+class CachedBook:
+    def __init__(self, stamp, entries):
+        self.stamp = stamp
+        self.entries = entries  # 与 WordManager.vocabulary 共用，只读
+        self.views = None  # 该单词本已构建的排列视图
+        self.weights = None  # 该单词本的单词权重 {单词: 权重}，与 WordManager.word_weights 共用
+        self.nbytes = entries_bytes(entries)
+
+class BookCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.books = OrderedDict()  # 路径 -> CachedBook，最近使用的在末尾
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, file_path, loader):
+        """返回缓存的单词本，未缓存或已修改时调用 loader(file_path) 重新解析"""
+        stat = os.stat(file_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        book = self.books.get(file_path)
+        if book is not None and book.stamp == stamp:
+            self.books.move_to_end(file_path)
+            self.hits += 1
+            return book
+        self.misses += 1
+        if book is not None:
+            self._remove(file_path)
+        book = CachedBook(stamp, loader(file_path))
+        self.books[file_path] = book
+        self.total_bytes += book.nbytes
+        self._evict()
+        return book
+
+    def add_bytes(self, file_path, nbytes):
+        """为单词本附加的数据（如排列视图）计入内存占用"""
+        book = self.books.get(file_path)
+        if book is not None:
+            book.nbytes += nbytes
+            self.total_bytes += nbytes
+            self._evict()
+
+    def _remove(self, file_path):
+        book = self.books.pop(file_path)
+        self.total_bytes -= book.nbytes
+
+    def _evict(self):
+        # 至少保留最近使用的一本，即使它本身超过上限
+        while self.total_bytes > self.max_bytes and len(self.books) > 1:
+            file_path = next(iter(self.books))
+            self._remove(file_path)
+            self.evictions += 1
+
+    def clear(self):
+        self.books.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        return {"books": len(self.books), "bytes": self.total_bytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
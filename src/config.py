@@ -34,6 +34,9 @@ class Config:
                 "default_font_size": 22,
                 "default_interval": 2.5,
                 "default_scroll_mode": "下一文件",
+                "default_order_view": "文件顺序",
+                "flash_mode": False,
+                "flash_interval_ms": 50,
                 "window_width": 500,
                 "window_height": 120,
                 "current_index": 7,
@@ -43,6 +46,13 @@ class Config:
             "combobox": {
                 "background_color": "white",
                 "text_color": "black"
+            },
+            "diagnostics": {
+                "log_interval": 0
+            },
+            "cache": {
+                "max_bytes": 67108864,
+                "history_size": 1000
             }
         }
         self.load_config()
@@ -1,26 +1,68 @@
-import sys
 import os
+import time
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, 
     QPushButton, QMessageBox, QMenu, QDialog, QSpinBox, QDoubleSpinBox,
-    QComboBox, QFileDialog, QSlider, QGroupBox, QFormLayout
+    QComboBox, QFileDialog, QSlider, QGroupBox, QFormLayout, QCheckBox,
+    QTableView, QAbstractItemView, QHeaderView
+)
+from PySide6.QtGui import QFont, Qt, QMouseEvent, QKeyEvent, QPalette, QColor
+from PySide6.QtCore import (
+    QTimer, Property, Signal, Slot, QPoint, QSettings, QAbstractTableModel, QModelIndex, QEvent
 )
-from PySide6.QtGui import QFont, Qt, QMouseEvent, QKeyEvent, QPalette, QColor, QAction
-from PySide6.QtCore import QTimer, Property, Signal, Slot, QPoint, QSettings
 from config import config
+from word_manager import SCROLL_MODES
+from weighted_sampling import DEFAULT_WEIGHT
+from word_order import ORDER_VIEWS, DEFAULT_ORDER_VIEW
+from memory_diagnostics import MemoryDiagnostics, format_bytes
+from session_trace import SessionRecorder
+
+def save_settings_values(settings):
+    """把 SettingsDialog.get_settings 格式的设置写入配置"""
+    config.set("app", "default_font_size", settings["font_size"])
+    config.set("app", "default_scroll_mode", settings["scroll_mode"])
+    config.set("app", "default_order_view", settings["order_view"])
+    config.set("app", "default_interval", settings["interval"])
+    config.set("app", "flash_mode", settings["flash_mode"])
+    config.set("app", "flash_interval_ms", settings["flash_interval_ms"])
 
-def get_base_dir():
-    if getattr(sys, 'frozen', False):
-        return os.path.dirname(sys.executable)
-    else:
-        return os.path.dirname(os.path.abspath(__file__))
+LABEL_TEXT_COLOR = "white"
+TOP_SPACING = 10
+
+def create_word_labels(widget):
+    """创建主窗口的布局和单词、释义标签，返回 (布局, 单词标签, 释义标签)。批量导出用同一函数计算文字位置"""
+    layout = QVBoxLayout()
+    layout.setContentsMargins(0, 0, 0, 0)
+    widget.setLayout(layout)
+    
+    # 添加顶部间距
+    layout.addSpacing(TOP_SPACING)
+    
+    # 单词显示标签
+    word_label = QLabel("")
+    word_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    word_label.setStyleSheet(f"color: {LABEL_TEXT_COLOR}; background-color: transparent;")
+    layout.addWidget(word_label)
+    
+    # 解释显示标签
+    meaning_label = QLabel("")
+    meaning_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    meaning_label.setStyleSheet(f"color: {LABEL_TEXT_COLOR}; background-color: transparent; font-size: 16px;")
+    layout.addWidget(meaning_label)
+    return layout, word_label, meaning_label
+
+def apply_label_font(word_label, meaning_label, font_size):
+    """原文和翻译使用相同字体（释义标签样式中的 font-size 会覆盖字号）"""
+    font = QFont("Arial", font_size)
+    word_label.setFont(font)
+    meaning_label.setFont(font)
 
 class SettingsDialog(QDialog):
     """设置对话框"""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("设置")
-        self.setFixedSize(400, 300)
+        self.setFixedSize(400, 440)
         self.setup_ui()
         self.load_settings()
         # 应用设置对话框样式
@@ -46,10 +88,15 @@ class SettingsDialog(QDialog):
         scroll_layout = QFormLayout()
         
         self.scroll_mode_combo = QComboBox()
-        self.scroll_mode_combo.addItems(["播完停止", "文件内循环", "下一文件"])
+        self.scroll_mode_combo.addItems(SCROLL_MODES)
         self.scroll_mode_combo.setStyleSheet(config.get_combobox_style())
         scroll_layout.addRow("模式:", self.scroll_mode_combo)
         
+        self.order_view_combo = QComboBox()
+        self.order_view_combo.addItems(ORDER_VIEWS)
+        self.order_view_combo.setStyleSheet(config.get_combobox_style())
+        scroll_layout.addRow("顺序:", self.order_view_combo)
+        
         scroll_group.setLayout(scroll_layout)
         layout.addWidget(scroll_group)
         
@@ -70,6 +117,23 @@ class SettingsDialog(QDialog):
         interval_group.setLayout(interval_layout)
         layout.addWidget(interval_group)
         
+        # 快速闪现设置
+        flash_group = QGroupBox("快速闪现（RSVP）")
+        flash_layout = QFormLayout()
+        
+        self.flash_mode_check = QCheckBox("启用（不做淡入淡出，按毫秒切换）")
+        flash_layout.addRow(self.flash_mode_check)
+        
+        self.flash_interval_spin = QSpinBox()
+        self.flash_interval_spin.setRange(10, 1000)  # 10毫秒到1000毫秒
+        self.flash_interval_spin.setSingleStep(10)
+        self.flash_interval_spin.setSuffix(" 毫秒")
+        self.flash_interval_spin.setToolTip("设置范围：10毫秒 - 1000毫秒")
+        flash_layout.addRow("间隔:", self.flash_interval_spin)
+        
+        flash_group.setLayout(flash_layout)
+        layout.addWidget(flash_group)
+        
         # 按钮
         button_layout = QHBoxLayout()
         self.ok_button = QPushButton("确定")
@@ -89,22 +153,221 @@ class SettingsDialog(QDialog):
         """加载设置"""
         self.font_size_spin.setValue(config.get("app", "default_font_size", 48))
         self.scroll_mode_combo.setCurrentText(config.get("app", "default_scroll_mode", "文件内循环"))
+        self.order_view_combo.setCurrentText(config.get("app", "default_order_view", DEFAULT_ORDER_VIEW))
         self.interval_spin.setValue(config.get("app", "default_interval", 2.5))
+        self.flash_mode_check.setChecked(config.get("app", "flash_mode", False))
+        self.flash_interval_spin.setValue(config.get("app", "flash_interval_ms", 50))
     
     def save_settings(self):
         """保存设置"""
-        config.set("app", "default_font_size", self.font_size_spin.value())
-        config.set("app", "default_scroll_mode", self.scroll_mode_combo.currentText())
-        config.set("app", "default_interval", round(self.interval_spin.value(), 1))
+        save_settings_values(self.get_settings())
     
     def get_settings(self):
         """获取设置值"""
         return {
             "font_size": self.font_size_spin.value(),
             "scroll_mode": self.scroll_mode_combo.currentText(),
-            "interval": round(self.interval_spin.value(), 1)
+            "order_view": self.order_view_combo.currentText(),
+            "interval": round(self.interval_spin.value(), 1),
+            "flash_mode": self.flash_mode_check.isChecked(),
+            "flash_interval_ms": self.flash_interval_spin.value()
         }
 
+class BookCatalogModel(QAbstractTableModel):
+    """单词本目录模型，只使用目录中缓存的元数据，行按需分批加入视图"""
+    COLUMNS = ["单词本", "词条数", "大小", "进度", "最近打开", "格式错误"]
+    BATCH_SIZE = 200
+    
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.order = list(range(len(library.files)))  # 排序后的单词本索引
+        self.loaded = 0  # 已加入视图的行数
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.loaded < len(self.order)
+    
+    def fetchMore(self, parent):
+        count = min(self.BATCH_SIZE, len(self.order) - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        book_index = self.order[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.TextAlignmentRole and column > 0:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        meta = self.library.get_meta(book_index)
+        if column == 0:
+            return self.library.get_name(book_index)
+        if column == 1:
+            return str(meta.get("count", 0))
+        if column == 2:
+            return format_bytes(meta.get("size", 0))
+        if column == 3:
+            return f"{self.library.get_progress(book_index):.0%}"
+        if column == 4:
+            last_opened = meta.get("last_opened", 0)
+            return time.strftime("%Y-%m-%d %H:%M", time.localtime(last_opened)) if last_opened else ""
+        return str(meta.get("errors", 0))
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """按元数据排序，排序后重新分批加载"""
+        keys = [
+            lambda i: self.library.get_name(i).casefold(),
+            lambda i: self.library.get_meta(i).get("count", 0),
+            lambda i: self.library.get_meta(i).get("size", 0),
+            self.library.get_progress,
+            lambda i: self.library.get_meta(i).get("last_opened", 0),
+            lambda i: self.library.get_meta(i).get("errors", 0),
+        ]
+        self.beginResetModel()
+        self.order.sort(key=keys[column], reverse=order == Qt.SortOrder.DescendingOrder)
+        self.loaded = 0
+        self.endResetModel()
+    
+    def book_name(self, row):
+        return self.library.get_name(self.order[row])
+
+class BookPickerDialog(QDialog):
+    """选择单词本对话框"""
+    def __init__(self, word_manager, parent=None):
+        super().__init__(parent)
+        self.word_manager = word_manager
+        self.setWindowTitle("选择单词本")
+        self.resize(640, 420)
+        self.setup_ui()
+        self.setStyleSheet(config.get_settings_dialog_style())
+    
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        
+        # 说明标签
+        label = QLabel("请选择要使用的单词本文件（点击表头排序）：")
+        layout.addWidget(label)
+        
+        # 单词本列表
+        self.table_view = QTableView()
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_view.verticalHeader().setVisible(False)
+        # 应用白底黑字样式
+        self.table_view.setStyleSheet("QTableView { background-color: white; color: black; }")
+        self.table_view.doubleClicked.connect(self.accept)
+        self.set_model()
+        layout.addWidget(self.table_view)
+        
+        # 按钮
+        button_layout = QHBoxLayout()
+        self.refresh_button = QPushButton("刷新")
+        self.ok_button = QPushButton("确定")
+        self.cancel_button = QPushButton("取消")
+        
+        self.refresh_button.clicked.connect(self.refresh)
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button.clicked.connect(self.reject)
+        
+        button_layout.addWidget(self.refresh_button)
+        button_layout.addStretch()
+        button_layout.addWidget(self.ok_button)
+        button_layout.addWidget(self.cancel_button)
+        
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+    
+    def set_model(self):
+        self.model = BookCatalogModel(self.word_manager.library, self)
+        self.table_view.setModel(self.model)
+        # 表头的列在设置模型之后才存在，每次换模型都要重新设置
+        self.table_view.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table_view.setSortingEnabled(True)
+        # 表头默认的排序标记是降序，打开时按名称升序排列
+        self.table_view.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+    
+    def refresh(self):
+        """重新扫描词库目录（只重新统计修改过的单词本）"""
+        self.word_manager.refresh_catalog()
+        self.set_model()
+    
+    def selected_book_name(self):
+        rows = self.table_view.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.model.book_name(rows[0].row())
+
+FLASH_TITLE_INTERVAL = 0.25  # 快速闪现时窗口标题每秒最多刷新4次
+
+class FlashStats:
+    """快速闪现计数
+
+    不读取 WordManager 的状态：每个时隙（预定时刻之间的间隔）应当画出一个新单词，
+    标签实际重绘时（eventFilter 中的 Paint 事件）核对画出的文字是否就是本时隙应显示的单词；
+    单词的位置（单词本, 行号）与上一个时隙相同时计为重复，不计入显示数。
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.shown = 0  # 确实画出来的单词数（不含重复）
+        self.repeated = 0  # 与上一个时隙位置相同的单词数（如播完停止后一直显示最后一个单词）
+        self.dropped = 0  # 取出后还没画出来就被下一个单词替换的单词数
+        self.missed = 0  # 没有显示新单词的时隙数（上一个单词多停留了一个间隔）
+        self.max_lag = 0.0  # 相对预定时刻的最大延迟
+        self.seq = 0  # 当前应显示的单词序号，每个时隙加一
+        self.painted_seq = 0  # 已经画出来的单词序号
+        self.expected = None  # 当前序号应显示的 (单词, 释义)
+        self.location = None  # 当前序号的单词位置 (单词本, 行号)
+        self.expected_repeat = False  # 当前序号是否重复上一个时隙的单词
+        self.started = time.perf_counter()
+    
+    def begin_word(self, word, meaning, location):
+        """开始显示下一个单词；上一个单词如果还没画出来就计为丢失，位置与上一个单词相同时计为重复"""
+        if self.painted_seq < self.seq:
+            self.dropped += 1
+        self.expected_repeat = self.seq > 0 and location == self.location
+        if self.expected_repeat:
+            self.repeated += 1
+        self.seq += 1
+        self.expected = (word, meaning)
+        self.location = location
+    
+    def painted(self, word, meaning):
+        """标签重绘时调用，只有画出的文字与当前序号应显示的单词一致才算显示"""
+        if self.painted_seq < self.seq and (word, meaning) == self.expected:
+            self.painted_seq = self.seq
+            if not self.expected_repeat:
+                self.shown += 1
+    
+    def record_slot(self, missed, lag):
+        self.missed += missed
+        self.max_lag = max(self.max_lag, lag)
+    
+    def summary(self):
+        elapsed = time.perf_counter() - self.started
+        rate = self.shown / elapsed if elapsed > 0 else 0.0
+        return (f"闪现 {self.shown} 个，丢失 {self.dropped}，重复 {self.repeated}，错过时隙 {self.missed}，"
+                f"最大延迟 {self.max_lag * 1000:.1f} 毫秒，{rate:.1f} 个/秒")
+
 class WordScrollerWindow(QWidget):
     """单词滚动显示器主窗口"""
     
@@ -112,10 +375,17 @@ class WordScrollerWindow(QWidget):
         super().__init__()
         self.word_manager = word_manager
         self.is_locked = False  # 锁定状态
+        self._display_position = None  # 正在显示的单词在所有单词本中的位置 (位置, 总数)
+        self._next_position = None
+        self._display_word_index = None  # 正在显示的单词 (单词本索引, 行号)
+        self._next_word_index = None
+        self.recorder = None  # 会话录制
+        self.replaying = False  # 回放会话时不弹出模态对话框
         self.setup_window()
         self.setup_ui()
         self.setup_menu()
         self.load_settings()
+        self.setup_diagnostics()
         self.start_word_display()
         # 设置文件切换回调
         self.word_manager.set_file_changed_callback(self.update_window_title)
@@ -143,24 +413,7 @@ class WordScrollerWindow(QWidget):
     
     def setup_ui(self):
         """设置用户界面"""
-        self.layout = QVBoxLayout()
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(self.layout)
-        
-        # 添加顶部间距
-        self.layout.addSpacing(10)
-        
-        # 单词显示标签
-        self.word_label = QLabel("")
-        self.word_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.word_label.setStyleSheet("color: white; background-color: transparent;")
-        self.layout.addWidget(self.word_label)
-        
-        # 解释显示标签
-        self.meaning_label = QLabel("")
-        self.meaning_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.meaning_label.setStyleSheet("color: white; background-color: transparent; font-size: 16px;")
-        self.layout.addWidget(self.meaning_label)
+        self.layout, self.word_label, self.meaning_label = create_word_labels(self)
         
         # 初始化动画状态变量
         self._current_word_for_display = ""
@@ -173,54 +426,118 @@ class WordScrollerWindow(QWidget):
         # 单词切换定时器
         self.word_change_timer = QTimer(self)
         self.word_change_timer.timeout.connect(self.next_word_and_animate)
+        
+        # 淡入淡出定时器（只创建一次，反复使用）
+        self.fade_timer = QTimer(self)
+        self.fade_timer.timeout.connect(self.on_fade_timer)
+        
+        # 快速闪现定时器：高精度单次定时器，每次按预定时刻计算等待时间，定时误差不会累积
+        self.flash_timer = QTimer(self)
+        self.flash_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.flash_timer.setSingleShot(True)
+        self.flash_timer.timeout.connect(self.on_flash_timer)
+        self.flash_stats = FlashStats()
+        self._flash_start = 0.0  # 第 n 个时隙的预定时刻为 _flash_start + n * 间隔
+        self._flash_slot = 0
+        # 在标签实际重绘时核对画出的单词
+        self.word_label.installEventFilter(self)
+        self.meaning_label.installEventFilter(self)
+        self._title_updated_at = 0.0
     
     def setup_menu(self):
-        """设置右键菜单"""
+        """设置右键菜单（只创建一次，每次弹出时更新菜单项文字，不会每次右键都新建 QObject）"""
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
-    
-    def show_context_menu(self, position):
-        """显示右键菜单"""
-        menu = QMenu(self)
-        menu.setStyleSheet(config.get_context_menu_style())
         
-        # 设置选项
-        settings_action = QAction("设置", self)
-        settings_action.triggered.connect(self.show_settings)
-        menu.addAction(settings_action)
+        self.context_menu = QMenu(self)
+        self.context_menu.setStyleSheet(config.get_context_menu_style())
         
+        # 设置选项
+        self.context_menu.addAction("设置", self.show_settings)
         # 选择单词本选项
-        select_vocab_action = QAction("选择单词本", self)
-        select_vocab_action.triggered.connect(self.select_vocabulary_file)
-        menu.addAction(select_vocab_action)
-        
+        self.context_menu.addAction("选择单词本", self.select_vocabulary_file)
+        # 跳转选项
+        self.context_menu.addAction("跳转", self.show_seek_dialog)
         # 导入选项
-        import_action = QAction("导入", self)
-        import_action.triggered.connect(self.import_files)
-        menu.addAction(import_action)
+        self.context_menu.addAction("导入", self.import_files)
+        # 内存诊断选项
+        self.context_menu.addAction("内存诊断", self.show_memory_diagnostics)
         
-        menu.addSeparator()
+        self.context_menu.addSeparator()
         
+        # 难词标记选项（加权随机模式下难词出现得更频繁）
+        self.hard_action = self.context_menu.addAction("标记为难词", self.toggle_hard_word)
         # 锁定/解锁选项
+        self.lock_action = self.context_menu.addAction("无边框模式", self.toggle_lock)
+    
+    def show_context_menu(self, position):
+        """显示右键菜单"""
+        self.hard_action.setText("取消难词标记" if self.is_displayed_word_hard() else "标记为难词")
+        self.lock_action.setText("解除无边框模式" if self.is_locked else "无边框模式")
+        self.context_menu.exec(self.mapToGlobal(position))
+    
+    def toggle_lock(self):
+        """切换无边框模式"""
         if self.is_locked:
-            unlock_action = QAction("解除无边框模式", self)
-            unlock_action.triggered.connect(self.unlock_window)
-            menu.addAction(unlock_action)
+            self.unlock_window()
         else:
-            lock_action = QAction("无边框模式", self)
-            lock_action.triggered.connect(self.lock_window)
-            menu.addAction(lock_action)
-        
-        menu.exec(self.mapToGlobal(position))
+            self.lock_window()
     
     def show_settings(self):
         """显示设置对话框"""
         dialog = SettingsDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            dialog.save_settings()
-            self.word_manager.load_config()  # 新增：强制刷新配置
-            self.load_settings()
-            self.apply_settings()
+            self.apply_settings_values(dialog.get_settings())
+    
+    def apply_settings_values(self, settings):
+        """保存并应用设置对话框中的设置"""
+        self.record("settings", settings)
+        save_settings_values(settings)
+        self.word_manager.load_config()  # 新增：强制刷新配置
+        self.load_settings()
+        self.word_manager.set_order_view(self.order_view)  # 切换视图不改变当前单词
+        self.apply_settings()
+    
+    def start_recording(self, path):
+        """开始录制会话（定时切换和用户操作）"""
+        self.recorder = SessionRecorder(path, self.word_manager)
+    
+    def record(self, action, *args):
+        if self.recorder is not None:
+            self.recorder.record(action, *args)
+    
+    def show_message(self, title, text, warning=False):
+        """显示提示框，回放会话时只输出到日志"""
+        if self.replaying:
+            print(f"{title}: {text}")
+        elif warning:
+            QMessageBox.warning(self, title, text)
+        else:
+            QMessageBox.information(self, title, text)
+    
+    def setup_diagnostics(self):
+        """设置内存诊断，log_interval 大于0时定期输出诊断日志并用 tracemalloc 跟踪 Python 内存"""
+        log_interval = config.get("diagnostics", "log_interval", 0)
+        # 不定期输出日志时不跟踪，右键菜单中的诊断只比较 QObject 数量，不拖慢程序
+        self.memory_diagnostics = MemoryDiagnostics(self.word_manager, self, trace=log_interval > 0)
+        self.diagnostics_timer = QTimer(self)
+        self.diagnostics_timer.timeout.connect(self.log_memory_diagnostics)
+        if log_interval > 0:
+            # 在加载单词本之前开始跟踪，基线在第一次输出日志时（已进入稳定状态）记录
+            self.memory_diagnostics.start()
+            self.diagnostics_timer.start(int(log_interval * 1000))
+    
+    def log_memory_diagnostics(self):
+        """定期输出内存诊断日志"""
+        if self.memory_diagnostics.baseline is None:
+            self.memory_diagnostics.set_baseline()
+        print(self.memory_diagnostics.report())
+    
+    def show_memory_diagnostics(self):
+        """显示内存诊断报告，第一次查看时记录基线"""
+        if self.memory_diagnostics.baseline is None:
+            self.memory_diagnostics.set_baseline()
+        QMessageBox.information(self, "内存诊断", self.memory_diagnostics.report())
     
     def import_files(self):
         """导入文件"""
@@ -232,115 +549,179 @@ class WordScrollerWindow(QWidget):
         )
         
         if files:
-            # 复制文件到resources目录
-            resources_dir = os.path.join(get_base_dir(), "resources")
-            if not os.path.exists(resources_dir):
-                os.makedirs(resources_dir)
-
-            for file_path in files:
-                filename = os.path.basename(file_path)
-                dest_path = os.path.join(resources_dir, filename)
-
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as src:
-                        content = src.read()
-                    with open(dest_path, 'w', encoding='utf-8') as dst:
-                        dst.write(content)
-                except Exception as e:
-                    QMessageBox.warning(self, "导入失败", f"导入文件 {filename} 失败: {str(e)}")
-
-            # 重新加载词库
-            self.word_manager.load_all_vocabulary()
-            QMessageBox.information(self, "导入成功", f"成功导入 {len(files)} 个文件")
+            self.import_file_paths(files)
+
+    def import_file_paths(self, files):
+        """复制文件到resources目录并重新加载词库"""
+        self.record("import", files)
+        resources_dir = self.word_manager.get_resources_dir()
+        if not os.path.exists(resources_dir):
+            os.makedirs(resources_dir)
+
+        for file_path in files:
+            filename = os.path.basename(file_path)
+            dest_path = os.path.join(resources_dir, filename)
+
+            try:
+                with open(file_path, 'r', encoding='utf-8') as src:
+                    content = src.read()
+                with open(dest_path, 'w', encoding='utf-8') as dst:
+                    dst.write(content)
+            except Exception as e:
+                self.show_message("导入失败", f"导入文件 {filename} 失败: {str(e)}", warning=True)
+
+        # 重新加载词库
+        self.word_manager.load_all_vocabulary()
+        self.show_message("导入成功", f"成功导入 {len(files)} 个文件")
 
     def select_vocabulary_file(self):
         """选择单词本文件"""
         # 获取当前可用的词库文件列表
-        resources_dir = os.path.join(get_base_dir(), "resources")
+        resources_dir = self.word_manager.get_resources_dir()
         if not os.path.exists(resources_dir):
             QMessageBox.warning(self, "错误", "词库目录不存在")
             return
 
-        # 获取所有txt文件
-        txt_files = []
-        for filename in os.listdir(resources_dir):
-            if filename.endswith('.txt'):
-                txt_files.append(filename)
-
-        if not txt_files:
+        # 使用单词本目录中已扫描的单词本，不再重新读取目录
+        if not self.word_manager.files:
             QMessageBox.warning(self, "错误", "没有找到词库文件")
             return
 
-        # 创建选择对话框
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QListWidget, QPushButton, QHBoxLayout, QLabel
+        # 显示选择对话框
+        dialog = BookPickerDialog(self.word_manager, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            selected_file = dialog.selected_book_name()
+            if selected_file:
+                # 切换到选中的文件
+                self.switch_to_vocabulary_file(selected_file)
+
+    def get_displayed_word_index(self):
+        """正在显示的单词在当前单词本中的行号，单词本已切换时返回None"""
+        if self._display_word_index is None:
+            return None
+        file_index, index = self._display_word_index
+        if file_index != self.word_manager.current_file_index or index >= self.word_manager.get_vocabulary_size():
+            return None
+        return index
+    
+    def is_displayed_word_hard(self):
+        index = self.get_displayed_word_index()
+        return index is not None and self.word_manager.get_word_weight(index) != DEFAULT_WEIGHT
+    
+    def toggle_hard_word(self):
+        """标记/取消标记正在显示的单词为难词"""
+        self.record("hard")
+        index = self.get_displayed_word_index()
+        if index is not None:
+            self.word_manager.toggle_hard_word(index)
+    
+    def show_seek_dialog(self):
+        """跳转到所有单词本中的任意位置"""
+        total = self.word_manager.library.total
+        if not self.word_manager.is_loaded or total == 0:
+            QMessageBox.warning(self, "错误", "没有可跳转的单词")
+            return
 
         dialog = QDialog(self)
-        dialog.setWindowTitle("选择单词本")
-        dialog.setFixedSize(400, 300)
+        dialog.setWindowTitle("跳转")
+        dialog.setFixedSize(400, 160)
         dialog.setStyleSheet(config.get_settings_dialog_style())
 
         layout = QVBoxLayout()
 
-        # 说明标签
-        label = QLabel("请选择要使用的单词本文件：")
-        layout.addWidget(label)
+        # 位置对应的单词本（只查前缀和，不加载单词本）
+        book_label = QLabel("")
+        layout.addWidget(book_label)
 
-        # 文件列表
-        list_widget = QListWidget()
-        list_widget.addItems(txt_files)
-        # 应用白底黑字样式
-        list_widget.setStyleSheet("QListWidget { background-color: white; color: black; }")
-        layout.addWidget(list_widget)
+        slider = QSlider(Qt.Orientation.Horizontal)
+        slider.setRange(1, total)
+        spin = QSpinBox()
+        spin.setRange(1, total)
+        spin.setSuffix(f" / {total}")
+        slider.valueChanged.connect(spin.setValue)
+        spin.valueChanged.connect(slider.setValue)
+
+        def update_book_label(value):
+            file_index, position = self.word_manager.library.locate(value - 1)
+            file_name = self.word_manager.library.get_name(file_index)
+            book_label.setText(f"单词本：{file_name}  第 {position + 1} 个")
+
+        slider.valueChanged.connect(update_book_label)
+        current, _ = self._display_position or self.word_manager.get_global_position()
+        slider.setValue(current + 1)
+        update_book_label(current + 1)
+
+        seek_layout = QHBoxLayout()
+        seek_layout.addWidget(slider)
+        seek_layout.addWidget(spin)
+        layout.addLayout(seek_layout)
 
         # 按钮
         button_layout = QHBoxLayout()
         ok_button = QPushButton("确定")
         cancel_button = QPushButton("取消")
-
         ok_button.clicked.connect(dialog.accept)
         cancel_button.clicked.connect(dialog.reject)
-
         button_layout.addStretch()
         button_layout.addWidget(ok_button)
         button_layout.addWidget(cancel_button)
-
         layout.addLayout(button_layout)
         dialog.setLayout(layout)
 
-        # 显示对话框
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            selected_items = list_widget.selectedItems()
-            if selected_items:
-                selected_file = selected_items[0].text()
-                # 切换到选中的文件
-                self.switch_to_vocabulary_file(selected_file)
+            self.seek_to(spin.value() - 1)
+
+    def seek_to(self, global_index):
+        """跳转到所有单词本中的 global_index 处并立即显示"""
+        self.record("seek", global_index)
+        self.word_manager.seek(global_index)
+        self.show_current_word_now()
+
+    def show_previous_word(self):
+        """后退到上一个显示过的单词（可跨单词本）"""
+        self.record("back")
+        if self.word_manager.is_loaded and self.word_manager.history_back():
+            self.show_current_word_now()
+
+    def show_current_word_now(self):
+        """立即显示当前单词，下一次切换显示它后面的单词"""
+        # 取消正在进行的淡入淡出，避免动画结束时覆盖刚显示的单词
+        self.fade_timer.stop()
+        self.animation_state = 0
+        self.opacity = 1.0
+        self._display_position = self.word_manager.get_global_position()
+        self._display_word_index = (self.word_manager.current_file_index, self.word_manager.current_index)
+        word, meaning = self.word_manager.get_current_word()
+        self.set_current_word_text(word)
+        self.set_current_meaning_text(meaning)
+        self.word_manager.get_next_word()
+        self.update_window_title()
+        if self.word_change_timer.isActive():
+            self.word_change_timer.start(self.word_change_interval_ms)
 
     def switch_to_vocabulary_file(self, filename):
         """切换到指定的词库文件"""
-        resources_dir = os.path.join(get_base_dir(), "resources")
+        self.record("switch", filename)
+        resources_dir = self.word_manager.get_resources_dir()
         file_path = os.path.join(resources_dir, filename)
         
         if not os.path.exists(file_path):
-            QMessageBox.warning(self, "错误", f"文件 {filename} 不存在")
+            self.show_message("错误", f"文件 {filename} 不存在", warning=True)
             return
         
         # 找到文件在列表中的索引
-        if hasattr(self.word_manager, 'files'):
-            for i, path in enumerate(self.word_manager.files):
-                if os.path.basename(path) == filename:
-                    self.word_manager.current_file_index = i
-                    self.word_manager.current_index = 0  # 重置到文件开头
-                    self.word_manager.load_current_file()
-                    self.word_manager.save_progress()
-                    # 更新窗口标题
-                    self.update_window_title()
-                    QMessageBox.information(self, "切换成功", f"已切换到单词本：{filename}")
-                    return
-        
-        QMessageBox.warning(self, "错误", f"无法找到文件 {filename}")
+        file_index = self.word_manager.find_file_index(filename)
+        if self.word_manager.switch_to_file(file_index):
+                # 更新窗口标题
+            self.update_window_title()
+            self.show_message("切换成功", f"已切换到单词本：{filename}")
+            return
+        
+        self.show_message("错误", f"无法找到文件 {filename}", warning=True)
     
     def lock_window(self):
         """无边框模式"""
+        self.record("lock")
         self.is_locked = True
         self.setWindowFlags(
             Qt.WindowType.WindowStaysOnTopHint
@@ -352,6 +733,7 @@ class WordScrollerWindow(QWidget):
 
     def unlock_window(self):
         """解除无边框模式"""
+        self.record("unlock")
         self.is_locked = False
         self.setWindowFlags(
             Qt.WindowType.WindowStaysOnTopHint
@@ -364,24 +746,61 @@ class WordScrollerWindow(QWidget):
         """加载设置"""
         self.font_size = config.get("app", "default_font_size", 22)
         self.scroll_mode = config.get("app", "default_scroll_mode", "下一文件")
+        self.order_view = config.get("app", "default_order_view", DEFAULT_ORDER_VIEW)
         self.interval = config.get("app", "default_interval", 3)
+        self.flash_mode = config.get("app", "flash_mode", False)
+        self.flash_interval_ms = config.get("app", "flash_interval_ms", 50)
     
     def apply_settings(self):
         """应用设置"""
         # 更新字体 - 原文和翻译使用相同字体
-        font = QFont("Arial", self.font_size)
-        self.word_label.setFont(font)
-        self.meaning_label.setFont(font)
+        apply_label_font(self.word_label, self.meaning_label, self.font_size)
         
         # 更新切换间隔
         self.word_change_interval_ms = int(self.interval * 1000)
-        if self.word_change_timer.isActive():
+        if self.word_change_timer.isActive() or self.flash_timer.isActive():
+            self.start_word_timer()
+    
+    def start_word_timer(self):
+        """按当前模式启动自动切换：普通模式带淡入淡出，快速闪现模式直接切换"""
+        if self.flash_mode:
+            self.word_change_timer.stop()
+            self.finish_fade()
+            self.flash_stats.reset()
+            self._flash_start = time.perf_counter()
+            self._flash_slot = 0
+            self.flash_timer.start(self.flash_interval_ms)
+        else:
+            if self.flash_stats.seq:
+                print(self.flash_stats.summary())
+                self.flash_stats.reset()
+            self.flash_timer.stop()
             self.word_change_timer.start(self.word_change_interval_ms)
     
+    def finish_fade(self):
+        """立即结束正在进行的淡入淡出，已取出但还没显示的单词直接显示"""
+        if self.animation_state == 1:
+            self.set_current_word_text(self._next_word_to_display)
+            self.set_current_meaning_text(self._next_meaning_to_display)
+            self._display_position = self._next_position
+            self._display_word_index = self._next_word_index
+        self.fade_timer.stop()
+        self.animation_state = 0
+        self.opacity = 1.0
+    
     def update_window_title(self):
         """根据当前词库文件名更新窗口标题"""
         file_name = self.word_manager.get_current_file_name() if hasattr(self.word_manager, 'get_current_file_name') else ""
-        self.setWindowTitle(f"滚动显示器  （单词本: {file_name}）")
+        if self._display_position is not None:
+            # 显示正在显示的单词在所有单词本中的位置
+            position, total = self._display_position
+            title = f"滚动显示器  （单词本: {file_name}  {position + 1}/{total}）"
+            if self.flash_timer.isActive() or self.flash_stats.seq:
+                title += (f"  闪现 {self.flash_stats.shown} 丢失 {self.flash_stats.dropped} "
+                          f"重复 {self.flash_stats.repeated} 错过 {self.flash_stats.missed}")
+            self.setWindowTitle(title)
+        else:
+            self.setWindowTitle(f"滚动显示器  （单词本: {file_name}）")
     
     def start_word_display(self):
         """开始单词显示"""
@@ -392,6 +811,8 @@ class WordScrollerWindow(QWidget):
         self.apply_settings()  # 应用字体等设置
 
         # 关键：首次启动时立即显示当前单词和释义
+        self._display_position = self.word_manager.get_global_position()
+        self._display_word_index = (self.word_manager.current_file_index, self.word_manager.current_index)
         current_word, current_meaning = self.word_manager.get_current_word()
         self.set_current_word_text(current_word)
         self.set_current_meaning_text(current_meaning)
@@ -400,7 +821,7 @@ class WordScrollerWindow(QWidget):
         self.update_window_title()
 
         # 启动定时器，后续自动切换
-        self.word_change_timer.start(self.word_change_interval_ms)
+        self.start_word_timer()
     
     # 属性设置
     def get_current_word_text(self):
@@ -419,7 +840,7 @@ class WordScrollerWindow(QWidget):
     
     def set_opacity(self, opacity):
         self._opacity = opacity
-        self.word_label.setStyleSheet(f"color: white; background-color: transparent; opacity: {opacity};")
+        self.word_label.setStyleSheet(f"color: {LABEL_TEXT_COLOR}; background-color: transparent; opacity: {opacity};")
     
     opacity = Property(float, get_opacity, set_opacity)
     
@@ -429,31 +850,93 @@ class WordScrollerWindow(QWidget):
         """获取下一个单词并开始动画"""
         if not self.word_manager.is_loaded:
             return
+        self.record("tick")
         
         word, meaning = self.word_manager.get_current_word()
         self._next_word_to_display = word
         self._next_meaning_to_display = meaning
+        self._next_position = self.word_manager.get_global_position()
+        self._next_word_index = (self.word_manager.current_file_index, self.word_manager.current_index)
         self.word_manager.get_next_word()
         
         if self.animation_state == 0:
             self.animation_state = 1
-            self.fade_timer = QTimer(self)
-            self.fade_timer.timeout.connect(self.fade_out)
             self.fade_timer.start(50)
         # 每次单词切换都刷新标题
         self.update_window_title()
     
+    def on_flash_timer(self):
+        """快速闪现定时器：在当前时隙显示下一个单词，并把定时器对准下一个时隙的预定时刻
+        
+        时隙按 _flash_start 对齐，定时误差不会累积；来晚时已经过去的时隙计为错过，单词不跳过。
+        """
+        interval = self.flash_interval_ms / 1000
+        now = time.perf_counter()
+        # 定时器按毫秒取整可能略早触发，至少进入下一个时隙
+        slot = max(self._flash_slot + 1, int((now - self._flash_start) / interval))
+        self.flash_stats.record_slot(slot - self._flash_slot - 1,
+                                     now - (self._flash_start + (self._flash_slot + 1) * interval))
+        self._flash_slot = slot
+        self.show_flash_word()
+        delay = self._flash_start + (slot + 1) * interval - time.perf_counter()
+        self.flash_timer.start(max(0, int(delay * 1000)))
+    
+    def show_flash_word(self):
+        """快速闪现：直接显示下一个单词，不做动画，只重绘内容变化的标签"""
+        if not self.word_manager.is_loaded:
+            return
+        self.record("flash")
+        word_index = (self.word_manager.current_file_index, self.word_manager.current_index)
+        word, meaning = self.word_manager.get_current_word()
+        self._display_position = self.word_manager.get_global_position()
+        self._display_word_index = word_index
+        self.word_manager.get_next_word()
+        self.flash_stats.begin_word(word, meaning, word_index)
+        # 立即重绘，保证下一次切换之前这个单词已经画出来
+        changed = False
+        if word != self.word_label.text():
+            self.word_label.setText(word)
+            self.word_label.repaint()
+            changed = True
+        if meaning != self.meaning_label.text():
+            self.meaning_label.setText(meaning)
+            self.meaning_label.repaint()
+            changed = True
+        if not changed:
+            # 与上一个单词文字相同，屏幕上已经是这个单词
+            self.flash_stats.painted(word, meaning)
+        now = time.perf_counter()
+        if now - self._title_updated_at >= FLASH_TITLE_INTERVAL:
+            self._title_updated_at = now
+            self.update_window_title()
+    
+    def eventFilter(self, obj, event):
+        """单词和释义标签重绘时记录画出的单词"""
+        if event.type() == QEvent.Type.Paint and (obj is self.word_label or obj is self.meaning_label):
+            self.flash_stats.painted(self.word_label.text(), self.meaning_label.text())
+        return super().eventFilter(obj, event)
+    
+    def on_fade_timer(self):
+        """按动画状态分派淡出或淡入"""
+        if self.animation_state == 1:
+            self.fade_out()
+        elif self.animation_state == 2:
+            self.fade_in()
+        else:
+            self.fade_timer.stop()
+    
     def fade_out(self):
         """淡出动画"""
         current_opacity = self.opacity
         if current_opacity > 0:
             self.opacity = max(0.0, current_opacity - 0.05)
         else:
-            self.fade_timer.stop()
             self.animation_state = 2
             self.set_current_word_text(self._next_word_to_display)
             self.set_current_meaning_text(self._next_meaning_to_display)
-            self.fade_timer.start(50)
+            self._display_position = self._next_position
+            self._display_word_index = self._next_word_index
+            self.update_window_title()
             self.fade_in()
     
     def fade_in(self):
@@ -471,8 +954,25 @@ class WordScrollerWindow(QWidget):
         if event.key() == Qt.Key.Key_Escape:
             if self.isFullScreen():
                 self.toggle_fullscreen()
+        elif event.key() == Qt.Key.Key_Left:
+            self.show_previous_word()
+        elif event.key() == Qt.Key.Key_Right:
+            # 立即显示下一个单词（后退后按历史记录前进）
+            if self.word_manager.is_loaded:
+                self.record("next")
+                self.show_current_word_now()
         event.accept()
     
+    def closeEvent(self, event):
+        """关闭窗口时保存单词本目录中尚未写入的元数据，结束会话录制"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+        if self.flash_stats.seq:
+            print(self.flash_stats.summary())
+        self.word_manager.close()
+        super().closeEvent(event)
+    
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         """双击事件处理"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -500,10 +1000,11 @@ class WordScrollerWindow(QWidget):
     
     def toggle_fullscreen(self):
         """切换全屏模式"""
+        self.record("fullscreen")
         if self.isFullScreen():
             self.showNormal()
             self.setStyleSheet(config.get_main_window_style())
         else:
             self.showFullScreen()
             self.setStyleSheet(config.get_main_window_style())
-            QMessageBox.information(self, "全屏模式", "按 Esc 键退出全屏模式") 
\ No newline at end of file
+            self.show_message("全屏模式", "按 Esc 键退出全屏模式") 
\ No newline at end of file
@@ -0,0 +1,56 @@
+# 浏览历史：固定容量的环形缓冲区，记录显示过的单词位置，支持后退/前进，各操作均为 O(1)
+
+DEFAULT_CAPACITY = 1000
+
+class NavigationHistory:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = max(0, capacity)  # 为0时不记录历史
+        self.items = [None] * self.capacity
+        self.start = 0  # 最旧一项在 items 中的下标
+        self.length = 0
+        self.cursor = -1  # 当前项的逻辑下标（0 为最旧）
+
+    def _get(self, index):
+        return self.items[(self.start + index) % self.capacity]
+
+    def visit(self, location):
+        """记录显示的位置
+
+        与当前项相同时不重复记录；与前进方向的下一项相同时只移动游标；否则丢弃前进方向的记录。
+        """
+        if not self.capacity:
+            return
+        if self.cursor >= 0 and self._get(self.cursor) == location:
+            return
+        if self.cursor + 1 < self.length and self._get(self.cursor + 1) == location:
+            self.cursor += 1
+            return
+        self.length = self.cursor + 1
+        if self.length == self.capacity:
+            # 已满，覆盖最旧的一项
+            self.start = (self.start + 1) % self.capacity
+            self.length -= 1
+        self.items[(self.start + self.length) % self.capacity] = location
+        self.length += 1
+        self.cursor = self.length - 1
+
+    def can_back(self):
+        return self.cursor > 0
+
+    def back(self):
+        """后退一项并返回该位置"""
+        if not self.can_back():
+            return None
+        self.cursor -= 1
+        return self._get(self.cursor)
+
+    def peek_forward(self):
+        """前进方向的下一项，没有时返回 None"""
+        if self.cursor + 1 < self.length:
+            return self._get(self.cursor + 1)
+        return None
+
+    def clear(self):
+        self.start = 0
+        self.length = 0
+        self.cursor = -1
@@ -0,0 +1,183 @@
+import os
+import json
+import time
+import bisect
+from array import array
+
+# 单词本目录：递归扫描 resources 目录，把所有单词本看作一个连续的序列
+# 每本单词本的元数据（词条数、大小、修改时间、上次位置、格式错误行数）保存在 library.json 中，
+# 按修改时间和大小增量刷新；通过前缀和数组在全局位置和（单词本, 行）之间互相换算，不需要加载单词本
+
+def is_valid_word_line(line):
+    """是否符合 "单词 词性.释义" 格式，规则与 WordManager.parse_word_line 一致"""
+    dot_index = line.find('.')
+    return dot_index != -1 and line.rfind(' ', 0, dot_index) != -1
+
+def count_entries(file_path):
+    """统计单词本的词条数（非空行数）和格式错误的行数，规则与 WordManager.read_book 一致，但不解析内容"""
+    count = 0
+    errors = 0
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                count += 1
+                if not is_valid_word_line(line):
+                    errors += 1
+    return count, errors
+
+def scan_books(resources_dir):
+    """用 os.scandir 递归查找所有 txt 单词本，返回 [(路径, os.stat_result), ...]，按相对路径排序"""
+    books = []
+    pending = [resources_dir]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith('.txt') and entry.is_file():
+                        books.append((entry.path, entry.stat()))
+        except OSError as e:
+            print(f"Error scanning {directory}: {e}")
+    books.sort(key=lambda book: os.path.relpath(book[0], resources_dir))
+    return books
+
+class Library:
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.resources_dir = ""
+        self.books = {}  # 文件路径 -> {"mtime_ns", "size", "count", "errors", "last_position", "last_opened"}
+        self.files = []
+        self.offsets = array('Q', [0])  # offsets[i] = 第 i 本之前的词条总数，最后一项为总数
+        self.dirty = False
+        self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.books = json.load(f).get("books", {})
+            # 旧版本的缓存把从未打开过的单词本的上次位置记为0
+            for meta in self.books.values():
+                if not meta.get("last_opened"):
+                    meta["last_position"] = None
+        except (OSError, ValueError):
+            self.books = {}
+
+    def save_cache(self):
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({"books": self.books}, f, ensure_ascii=False, indent=2)
+            self.dirty = False
+        except Exception as e:
+            print(f"Error saving library cache: {e}")
+
+    def flush(self):
+        """保存尚未写入的元数据（如上次位置）"""
+        if self.dirty:
+            self.save_cache()
+
+    def scan(self, resources_dir):
+        """扫描词库目录并增量刷新元数据，返回所有单词本路径"""
+        self.resources_dir = resources_dir
+        books = scan_books(resources_dir)
+        self._update([path for path, stat in books], dict(books))
+        return self.files
+
+    def _update(self, files, stats):
+        """只重新统计修改过的单词本，并重建前缀和"""
+        changed = False
+        books = {}
+        for file_path in files:
+            stat = stats[file_path]
+            meta = self.books.get(file_path)
+            if meta is None or meta["mtime_ns"] != stat.st_mtime_ns or meta["size"] != stat.st_size:
+                try:
+                    count, errors = count_entries(file_path)
+                except Exception as e:
+                    print(f"Error counting file {file_path}: {e}")
+                    count, errors = 0, 0
+                previous = meta or {}
+                last_position = previous.get("last_position")
+                if last_position is not None:
+                    last_position = min(last_position, max(0, count - 1))
+                meta = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "count": count, "errors": errors,
+                        "last_position": last_position,  # 从未打开过时为 None
+                        "last_opened": previous.get("last_opened", 0)}
+                changed = True
+            books[file_path] = meta
+        if changed or set(books) != set(self.books):
+            self.books = books
+            self.save_cache()
+        self.books = books
+        self.files = files
+        self._rebuild_offsets()
+
+    def _rebuild_offsets(self):
+        offsets = array('Q', [0])
+        for file_path in self.files:
+            offsets.append(offsets[-1] + self.books[file_path]["count"])
+        self.offsets = offsets
+
+    def update_count(self, book_index, count):
+        """单词本加载后用实际词条数校正缓存"""
+        if not 0 <= book_index < len(self.files):
+            return
+        meta = self.books[self.files[book_index]]
+        if meta["count"] != count:
+            meta["count"] = count
+            self._rebuild_offsets()
+            self.save_cache()
+
+    def mark_opened(self, book_index):
+        if 0 <= book_index < len(self.files):
+            self.books[self.files[book_index]]["last_opened"] = time.time()
+            self.dirty = True
+
+    def set_position(self, book_index, position):
+        """记录单词本内的上次位置（只修改内存，由 flush 保存）"""
+        if 0 <= book_index < len(self.files):
+            meta = self.books[self.files[book_index]]
+            if meta.get("last_position") != position:
+                meta["last_position"] = position
+                self.dirty = True
+
+    def get_meta(self, book_index):
+        return self.books[self.files[book_index]]
+
+    def get_name(self, book_index):
+        """单词本相对词库目录的路径，用于显示"""
+        file_path = self.files[book_index]
+        if self.resources_dir:
+            return os.path.relpath(file_path, self.resources_dir)
+        return os.path.basename(file_path)
+
+    def get_progress(self, book_index):
+        """已读比例，从未打开过的单词本为0"""
+        meta = self.get_meta(book_index)
+        count = meta.get("count", 0)
+        last_position = meta.get("last_position")
+        if last_position is None or not count:
+            return 0.0
+        return (last_position + 1) / count
+
+    @property
+    def total(self):
+        return self.offsets[-1]
+
+    def book_count(self, book_index):
+        return self.offsets[book_index + 1] - self.offsets[book_index]
+
+    def offset(self, book_index):
+        """第 book_index 本单词本第一个词条的全局位置"""
+        return self.offsets[book_index]
+
+    def locate(self, global_index):
+        """全局位置 -> (单词本索引, 本内位置)，O(log 单词本数)"""
+        if not self.files or self.total == 0:
+            return 0, 0
+        global_index = min(max(0, global_index), self.total - 1)
+        # 跳过空单词本：取最后一个起点不大于 global_index 的单词本
+        book_index = bisect.bisect_right(self.offsets, global_index) - 1
+        return book_index, global_index - self.offsets[book_index]
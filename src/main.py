@@ -1,13 +1,68 @@
 import sys
 import os
-from PySide6.QtWidgets import QApplication
+import argparse
+import multiprocessing
 from word_manager import WordManager
-from gui import WordScrollerWindow
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="单词滚动显示器")
+    parser.add_argument("--tty", action="store_true",
+                        help="在终端中运行（不加载 PySide6，适用于无图形界面或 SSH 环境）")
+    parser.add_argument("--stream", metavar="SOURCE",
+                        help="从流式输入读取单词：- 为标准输入，tcp:端口 为本地套接字，其他为命名管道或文件路径")
+    parser.add_argument("--stream-buffer", type=int, default=256, help="流式输入缓冲区大小（词条数）")
+    parser.add_argument("--stream-policy", choices=["drop", "block"], default="drop",
+                        help="缓冲区满时丢弃最旧的词条（drop）或暂停读取（block）")
+    parser.add_argument("--export", metavar="DIR",
+                        help="把单词本离线渲染成图片序列导出到 DIR，不显示窗口")
+    parser.add_argument("--book", help="只导出指定的单词本（相对词库目录的路径或文件名），默认导出全部")
+    parser.add_argument("--fade-frames", type=int, default=0,
+                        help="每次切换之间插入的淡入淡出过渡帧数")
+    parser.add_argument("--raw", action="store_true",
+                        help="输出原始 RGBA 帧流（frames.rgba）而不是 PNG 图片")
+    parser.add_argument("--workers", type=int, default=None, help="导出使用的进程数，默认为CPU核数")
+    parser.add_argument("--record", metavar="TRACE", help="把定时切换和用户操作录制到轨迹文件 TRACE")
+    parser.add_argument("--replay", metavar="TRACE", help="在后台（offscreen）回放轨迹文件 TRACE 并输出性能分析结果")
+    parser.add_argument("--replay-speed", type=float, default=0.0,
+                        help="回放速度：0 为全速（默认），1 为录制时的速度，2 为两倍速")
+    parser.add_argument("--profile", metavar="FILE", help="把回放的 cProfile 结果保存到 FILE（可用 pstats/snakeviz 查看）")
+    # Qt 自身的命令行参数（如 -platform）交给 QApplication 处理
+    args, _ = parser.parse_known_args(argv)
+    return args
 
 def main():
+    multiprocessing.freeze_support()  # 打包成 exe 后导出用的子进程需要
+    args = parse_args(sys.argv[1:])
+    if args.replay:
+        from session_trace import replay_session
+        ok = replay_session(args.replay, max(0.0, args.replay_speed), args.profile)
+        sys.exit(0 if ok else 1)
+    if args.stream:
+        if args.tty and args.stream == "-":
+            print("Error: --tty cannot read words from stdin, use a named pipe or tcp:PORT")
+            sys.exit(1)
+        from stream_source import StreamWordManager
+        word_manager = StreamWordManager(args.stream, max(1, args.stream_buffer), args.stream_policy)
+    else:
+        word_manager = WordManager()
+    if args.tty:
+        from terminal import run_terminal
+        run_terminal(word_manager)
+        return
+    if args.export:
+        from config import config
+        from batch_export import export_books
+        ok = export_books(word_manager, config, args.export, args.book,
+                          max(0, args.fade_frames), args.raw, args.workers)
+        sys.exit(0 if ok else 1)
+
+    # 仅图形界面模式才导入 PySide6
+    from PySide6.QtWidgets import QApplication
+    from gui import WordScrollerWindow
     app = QApplication(sys.argv)
-    word_manager = WordManager()
     window = WordScrollerWindow(word_manager)
+    if args.record:
+        window.start_recording(args.record)
     window.show()
     sys.exit(app.exec())
 
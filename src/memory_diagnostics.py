@@ -0,0 +1,220 @@
+import os
+import sys
+import contextlib
+import importlib.util
+import time
+import tracemalloc
+from book_cache import entries_bytes
+
+# 内存诊断：按组件统计内存占用、对比 tracemalloc 快照、检测内存持续增长
+# 本模块不依赖 PySide6，统计 Qt 对象时才按需导入
+
+GROWTH_RATIO = 0.2  # 相对基线增长超过 20% 视为增长
+GROWTH_MIN_BYTES = 1024 * 1024  # 且绝对增长超过 1MB
+MAX_SAMPLES = 1000
+FADE_STEPS = 42  # 一次完整的淡出（21步）和淡入（21步）
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+def count_qobjects(root):
+    """按类名统计 root 下所有存活的 QObject 子对象"""
+    from PySide6.QtCore import QObject
+    counts = {}
+    for child in root.findChildren(QObject):
+        name = type(child).__name__
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+class MemoryDiagnostics:
+    """内存诊断"""
+
+    def __init__(self, word_manager, qt_root=None, trace=True):
+        self.word_manager = word_manager
+        self.qt_root = qt_root
+        self.trace = trace  # 是否使用 tracemalloc；跟踪会拖慢整个程序，不定期输出日志时只比较 QObject 数量
+        self.snapshot = None  # 上一次 tracemalloc 快照
+        self.snapshot_time = None
+        self.baseline = None  # 进入稳定状态后的基线采样 (时间, tracemalloc 当前占用, QObject 数量)
+        self.samples = []  # 基线之后的采样 [(时间, tracemalloc 当前占用, QObject 数量), ...]
+
+    def start(self):
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def component_usage(self):
+        """统计各组件的内存占用"""
+        usage = {"books": [], "caches": {}, "qobjects": {}}
+        vocabulary = self.word_manager.vocabulary
+        book_cache = getattr(self.word_manager, "book_cache", None)
+        if book_cache is not None:
+            # 当前单词本和缓存中的其他单词本
+            for path, book in book_cache.books.items():
+                usage["books"].append((os.path.basename(path), len(book.entries), entries_bytes(book.entries)))
+        usage["caches"]["vocabulary 列表"] = sys.getsizeof(vocabulary)
+        views = self.word_manager.word_order.views
+        usage["caches"]["排列视图"] = sum(sys.getsizeof(order) + sys.getsizeof(rank)
+                                          for order, rank in views.values())
+        if book_cache is not None:
+            stats = book_cache.stats()
+            usage["caches"][f"单词本缓存（{stats['books']} 本，命中 {stats['hits']}，"
+                            f"未命中 {stats['misses']}，淘汰 {stats['evictions']}）"] = stats["bytes"]
+        if self.qt_root is not None:
+            usage["qobjects"] = count_qobjects(self.qt_root)
+        return usage
+
+    def take_snapshot(self):
+        """记录新的 tracemalloc 快照，返回与上一次快照的差异（前若干项）；不跟踪时返回 None"""
+        self.start()
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        previous, self.snapshot = self.snapshot, snapshot
+        previous_time, self.snapshot_time = self.snapshot_time, time.time()
+        if previous is None:
+            return None
+        stats = snapshot.compare_to(previous, "lineno")
+        return self.snapshot_time - previous_time, stats
+
+    def _measure(self):
+        current, _ = tracemalloc.get_traced_memory()
+        qobject_count = sum(count_qobjects(self.qt_root).values()) if self.qt_root is not None else 0
+        return time.time(), current, qobject_count
+
+    def set_baseline(self):
+        """记录基线。应在单词本加载完、程序进入稳定状态之后调用，之后的采样都与它比较"""
+        self.start()
+        self.baseline = self._measure()
+        self.samples = []
+        return self.baseline[1]
+
+    def sample(self):
+        """记录一次内存采样，用于检测持续增长"""
+        self.start()
+        measurement = self._measure()
+        self.samples.append(measurement)
+        if len(self.samples) > MAX_SAMPLES:
+            del self.samples[0]
+        return measurement[1]
+
+    def growth_warnings(self):
+        """与基线比较，返回增长警告；还没有基线时不做比较"""
+        if self.baseline is None or not self.samples:
+            return []
+        _, base_bytes, base_qobjects = self.baseline
+        _, last_bytes, last_qobjects = self.samples[-1]
+        warnings = []
+        growth = last_bytes - base_bytes
+        if growth > GROWTH_MIN_BYTES and growth > base_bytes * GROWTH_RATIO:
+            warnings.append(f"Python 内存持续增长：{format_bytes(base_bytes)} -> {format_bytes(last_bytes)}")
+        if last_qobjects > base_qobjects:
+            warnings.append(f"QObject 数量增长：{base_qobjects} -> {last_qobjects}")
+        return warnings
+
+    def report(self, top=10):
+        """生成诊断报告文本"""
+        lines = []
+        usage = self.component_usage()
+        lines.append("【单词本】")
+        for name, count, size in usage["books"]:
+            lines.append(f"  {name}: {count} 条, {format_bytes(size)}")
+        lines.append("【缓存】")
+        for name, size in usage["caches"].items():
+            lines.append(f"  {name}: {format_bytes(size)}")
+        if usage["qobjects"]:
+            lines.append(f"【Qt 对象】共 {sum(usage['qobjects'].values())} 个")
+            for name, count in sorted(usage["qobjects"].items(), key=lambda item: -item[1])[:top]:
+                lines.append(f"  {name}: {count}")
+        if tracemalloc.is_tracing():
+            lines.append(f"【tracemalloc】当前 {format_bytes(self.sample())}")
+        else:
+            self.sample()  # 不跟踪时仍比较 QObject 数量
+            if self.trace:
+                # 刚开始跟踪时没有任何记录，只有下一次诊断才有意义
+                lines.append("【tracemalloc】从本次诊断开始跟踪，下次诊断显示内存变化")
+            else:
+                lines.append("【tracemalloc】未跟踪（diagnostics.log_interval 大于0时跟踪 Python 内存）")
+        diff = self.take_snapshot()
+        if diff is not None:
+            elapsed, stats = diff
+            lines.append(f"  与 {elapsed:.0f} 秒前的快照相比：")
+            for stat in stats[:top]:
+                frame = stat.traceback[0]
+                lines.append(f"  {os.path.basename(frame.filename)}:{frame.lineno} "
+                             f"{format_bytes(stat.size_diff)} ({stat.count_diff:+d} 块)")
+        warnings = self.growth_warnings()
+        if warnings:
+            lines.append("【警告】")
+            lines.extend(f"  {warning}" for warning in warnings)
+        return "\n".join(lines)
+
+def run_soak(word_manager, ticks=100000, sample_every=10000, fade_steps=FADE_STEPS):
+    """长时间运行测试：在 offscreen 平台上驱动 WordScrollerWindow 连续切换单词（包括淡入淡出），
+    检查 Python 内存和窗口下的 QObject 数量是否有界"""
+    if importlib.util.find_spec("PySide6") is None:
+        print("Error: soak test requires PySide6")
+        return False
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    diagnostics = MemoryDiagnostics(word_manager)
+    diagnostics.start()  # 在加载单词本之前开始跟踪
+    from PySide6.QtWidgets import QApplication
+    from gui import WordScrollerWindow
+    app = QApplication.instance() or QApplication([])
+    # 切换文件时的日志输出太多，运行期间丢弃
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        window = WordScrollerWindow(word_manager)
+    if not word_manager.is_loaded:
+        window.close()
+        print("No vocabulary loaded")
+        return False
+    # 切换由下面的循环驱动，不使用真实定时器
+    window.word_change_timer.stop()
+    window.flash_timer.stop()
+    window.diagnostics_timer.stop()
+    diagnostics.qt_root = window
+    warmup = min(sample_every, ticks // 10)  # 预热之后才记录基线
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for tick in range(ticks):
+            window.next_word_and_animate()
+            for _ in range(fade_steps):
+                if not window.fade_timer.isActive():
+                    break
+                window.on_fade_timer()
+            app.processEvents()
+            if tick == warmup:
+                diagnostics.set_baseline()
+            elif tick > warmup and tick % sample_every == 0:
+                diagnostics.sample()
+        diagnostics.sample()
+        window.close()
+    warnings = diagnostics.growth_warnings()
+    for warning in warnings:
+        print(warning)
+    _, base_bytes, base_qobjects = diagnostics.baseline
+    _, last_bytes, last_qobjects = diagnostics.samples[-1]
+    print(f"Soak finished: {ticks} ticks, traced {format_bytes(base_bytes)} -> {format_bytes(last_bytes)}, "
+          f"QObjects {base_qobjects} -> {last_qobjects}")
+    return not warnings
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    from word_manager import WordManager, get_base_dir
+
+    # 在临时配置文件上运行，避免改写用户的进度
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        from pathlib import Path
+        from config import config
+        config_path = os.path.join(tmp_dir, "config.json")
+        shutil.copy(os.path.join(get_base_dir(), "config.json"), config_path)
+        config.config_file = Path(config_path)
+        config.load_config()
+        sys.exit(0 if run_soak(WordManager(config_path), ticks) else 1)
@@ -0,0 +1,240 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+from word_manager import WordManager
+from weighted_sampling import WEIGHTS_SUFFIX, load_weights, save_weights
+
+# 会话录制与回放：把定时切换和用户操作连同时间记录成紧凑的轨迹文件，
+# 回放时在 offscreen 平台上把轨迹重新交给 WordScrollerWindow 和 WordManager，可以全速或按录制速度运行并做性能分析
+#
+# 轨迹文件格式：第一行是 JSON 头（版本、随机种子、录制开始时的配置和各单词本的单词权重），
+# 之后每行一个事件 "距上一个事件的毫秒数 动作[ JSON参数]"，如 "2500 tick"、"8123 switch [\"words.txt\"]"
+
+TRACE_VERSION = 1
+FADE_STEP_MS = 50  # 与 WordScrollerWindow.next_word_and_animate 中淡入淡出定时器的间隔一致
+
+# 轨迹中的动作 -> WordScrollerWindow 中执行该动作的方法（不弹出对话框）
+ACTIONS = {
+    "tick": "next_word_and_animate",
+    "flash": "show_flash_word",
+    "settings": "apply_settings_values",
+    "switch": "switch_to_vocabulary_file",
+    "import": "import_file_paths",
+    "lock": "lock_window",
+    "unlock": "unlock_window",
+    "fullscreen": "toggle_fullscreen",
+    "back": "show_previous_word",
+    "next": "show_current_word_now",
+    "seek": "seek_to",
+    "hard": "toggle_hard_word",
+}
+
+class SessionRecorder:
+    """会话录制"""
+
+    def __init__(self, path, word_manager):
+        self.path = path
+        self.seed = random.randrange(2 ** 32)
+        # 录制和回放使用相同的随机种子，加权随机模式的抽样结果一致
+        random.seed(self.seed)
+        header = {"version": TRACE_VERSION, "seed": self.seed,
+                  "total_words": word_manager.library.total, "config": word_manager.config,
+                  "weights": snapshot_weights(word_manager)}
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write(json.dumps(header, ensure_ascii=False) + "\n")
+        self.file.flush()
+        self.last_time = time.monotonic()
+        self.events = 0
+
+    def record(self, action, *args):
+        if self.file is None:
+            return
+        now = time.monotonic()
+        delta = round((now - self.last_time) * 1000)
+        self.last_time += delta / 1000  # 按取整后的时间累加，长时间录制不会积累误差
+        line = f"{delta} {action}"
+        if args:
+            line += " " + json.dumps(args, ensure_ascii=False, separators=(',', ':'))
+        self.file.write(line + "\n")
+        self.events += 1
+        if action not in ("tick", "flash"):
+            # 用户操作立即写入，程序异常退出时也能保留
+            self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            print(f"Recorded {self.events} events to {self.path}")
+
+def snapshot_weights(word_manager):
+    """录制开始时各单词本的单词权重 {相对路径: {单词: 权重}}，只记录有非默认权重的单词本"""
+    library = word_manager.library
+    weights = {}
+    for i, file_path in enumerate(library.files):
+        book_weights = load_weights(file_path)
+        if book_weights:
+            weights[library.get_name(i)] = book_weights
+    return weights
+
+def restore_weights(resources_dir, weights):
+    """把词库副本中的权重文件替换为录制开始时的权重，录制过程中的难词标记不会影响回放"""
+    for directory, _, names in os.walk(resources_dir):
+        for name in names:
+            if name.endswith(WEIGHTS_SUFFIX):
+                os.remove(os.path.join(directory, name))
+    for name, book_weights in weights.items():
+        book_path = os.path.join(resources_dir, name)
+        if os.path.exists(book_path):
+            save_weights(book_path, book_weights)
+
+def read_trace(path):
+    """读取轨迹文件，返回 (头, 事件生成器)，事件为 (距开始的毫秒数, 动作, 参数列表)"""
+    f = open(path, 'r', encoding='utf-8')
+    header = json.loads(f.readline())
+    if header.get("version") != TRACE_VERSION:
+        f.close()
+        raise ValueError(f"unsupported trace version {header.get('version')}")
+
+    def events():
+        elapsed = 0
+        with f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line:
+                    continue
+                parts = line.split(" ", 2)
+                elapsed += int(parts[0])
+                args = json.loads(parts[2]) if len(parts) > 2 else []
+                yield elapsed, parts[1], args
+
+    return header, events()
+
+class ReplayWordManager(WordManager):
+    """使用指定词库目录的 WordManager，回放时在词库的临时副本上运行，不改动用户的单词本"""
+
+    def __init__(self, resources_dir, config_path):
+        self.resources_dir = resources_dir
+        super().__init__(config_path)
+
+    def get_resources_dir(self):
+        return self.resources_dir
+
+class SessionPlayer:
+    """把轨迹事件交给窗口执行
+
+    speed 为0时全速回放：不等待，淡入淡出按两个事件之间经过的录制时间逐步推进，结果与时钟无关；
+    speed 大于0时按录制速度（的 speed 倍）回放，运行真实的事件循环和定时器。
+    """
+
+    def __init__(self, app, window, speed=0.0):
+        self.app = app
+        self.window = window
+        self.speed = speed
+        self.counts = {}
+        self.elapsed_ms = 0  # 已回放的录制时间
+
+    def run(self, events):
+        start = time.monotonic()
+        for elapsed, action, args in events:
+            if action not in ACTIONS:
+                print(f"Skipping unknown action {action}")
+                continue
+            if self.speed > 0:
+                self.wait_until(start + elapsed / 1000 / self.speed)
+            else:
+                self.advance_fade(elapsed - self.elapsed_ms)
+            self.elapsed_ms = elapsed
+            getattr(self.window, ACTIONS[action])(*args)
+            self.counts[action] = self.counts.get(action, 0) + 1
+            if self.speed <= 0:
+                # 只处理重绘等已投递的事件，不触发定时器
+                self.app.sendPostedEvents()
+        return time.monotonic() - start
+
+    def advance_fade(self, delta_ms):
+        """全速回放时按录制时间推进淡入淡出动画"""
+        for _ in range(delta_ms // FADE_STEP_MS):
+            if not self.window.fade_timer.isActive():
+                break
+            self.window.on_fade_timer()
+
+    def wait_until(self, deadline):
+        """运行事件循环直到 deadline（time.monotonic 时间）"""
+        from PySide6.QtCore import QEventLoop, QTimer
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            self.app.processEvents()
+            return
+        loop = QEventLoop()
+        QTimer.singleShot(int(remaining * 1000), loop.quit)
+        loop.exec()
+
+def replay_session(trace_path, speed=0.0, profile_path=None, top=25):
+    """在 offscreen 平台上回放轨迹，输出耗时和性能分析结果"""
+    import cProfile
+    import pstats
+    from pathlib import Path
+    from word_manager import get_base_dir
+
+    header, events = read_trace(trace_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 配置使用录制开始时的快照，词库使用副本，回放中的导入、难词标记和进度都不会写回用户目录
+        config_path = os.path.join(tmp_dir, "config.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(header["config"], f, ensure_ascii=False, indent=2)
+        resources_dir = os.path.join(tmp_dir, "resources")
+        source_dir = os.path.join(get_base_dir(), "resources")
+        if os.path.exists(source_dir):
+            shutil.copytree(source_dir, resources_dir)
+        else:
+            os.makedirs(resources_dir)
+        if "weights" in header:
+            restore_weights(resources_dir, header["weights"])
+        else:
+            print("Warning: trace has no word weights, replaying with the current weights")
+
+        from config import config
+        config.config_file = Path(config_path)
+        config.load_config()
+        from PySide6.QtWidgets import QApplication
+        from gui import WordScrollerWindow
+        app = QApplication.instance() or QApplication([])
+        word_manager = ReplayWordManager(resources_dir, config_path)
+        window = WordScrollerWindow(word_manager)
+        window.replaying = True
+        # 定时切换由轨迹中的 tick 事件驱动
+        window.word_change_timer.stop()
+        window.flash_timer.stop()
+        window.show()
+        random.seed(header["seed"])
+        if word_manager.library.total != header.get("total_words"):
+            print(f"Warning: trace was recorded with {header.get('total_words')} words, "
+                  f"replaying with {word_manager.library.total}")
+
+        player = SessionPlayer(app, window, speed)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            elapsed = player.run(events)
+        finally:
+            profiler.disable()
+            window.close()
+
+    ticks = player.counts.get("tick", 0) + player.counts.get("flash", 0)
+    print(f"Replayed {sum(player.counts.values())} events "
+          f"({player.elapsed_ms / 1000:.1f} s recorded) in {elapsed:.2f} s, "
+          f"{ticks / elapsed if elapsed > 0 else 0:,.0f} ticks/s")
+    for action, count in sorted(player.counts.items()):
+        print(f"  {action}: {count}")
+    stats = pstats.Stats(profiler, stream=sys.stdout)
+    if profile_path:
+        stats.dump_stats(profile_path)
+        print(f"Profile saved to {profile_path}")
+    stats.sort_stats("cumulative").print_stats(top)
+    return True
@@ -0,0 +1,168 @@
+import os
+import sys
+import stat
+import socket
+import threading
+from collections import deque
+from word_manager import WordManager
+
+# 流式输入：从标准输入、命名管道或本地套接字逐行读取 "单词 词性.释义"，
+# 后台线程读取并放入有界缓冲区，界面线程只做非阻塞的取出，不会因为等待输入而卡住
+
+STREAM_POLICIES = ["drop", "block"]
+DEFAULT_BUFFER_SIZE = 256
+
+class StreamBuffer:
+    """有界环形缓冲区
+
+    drop：缓冲区满时丢弃最旧的词条；block：缓冲区满时读取线程等待。
+    """
+
+    def __init__(self, maxsize=DEFAULT_BUFFER_SIZE, policy="drop"):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.entries = deque()
+        self.dropped = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def put(self, entry):
+        with self.condition:
+            if len(self.entries) >= self.maxsize:
+                if self.policy == "block":
+                    while len(self.entries) >= self.maxsize and not self.closed:
+                        self.condition.wait()
+                    if self.closed:
+                        return
+                else:
+                    self.entries.popleft()
+                    self.dropped += 1
+            self.entries.append(entry)
+
+    def get_nowait(self):
+        """取出一个词条，没有时立即返回 None"""
+        with self.condition:
+            if not self.entries:
+                return None
+            entry = self.entries.popleft()
+            self.condition.notify()
+            return entry
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def __len__(self):
+        return len(self.entries)
+
+class StreamReader:
+    """后台读取线程
+
+    source 为 "-" 时读取标准输入，"tcp:端口" 时在 127.0.0.1 上监听，
+    其他值视为文件路径（命名管道在写入端关闭后会重新打开等待下一个写入者）。
+    """
+
+    def __init__(self, source, buffer, parse_line):
+        self.source = source
+        self.buffer = buffer
+        self.parse_line = parse_line
+        self.finished = False
+        self.thread = threading.Thread(target=self.run, name="stream-reader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def describe(self):
+        if self.source == "-":
+            return "stdin"
+        return self.source if self.source.startswith("tcp:") else os.path.basename(self.source)
+
+    def run(self):
+        try:
+            if self.source == "-":
+                self.read_lines(sys.stdin.buffer)
+            elif self.source.startswith("tcp:"):
+                self.serve_socket(int(self.source[4:]))
+            else:
+                self.read_path(self.source)
+        except Exception as e:
+            print(f"Error reading stream {self.source}: {e}")
+        finally:
+            self.finished = True
+
+    def read_lines(self, stream):
+        for raw_line in stream:
+            if self.buffer.closed:
+                return
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if line:
+                self.buffer.put(self.parse_line(line))
+
+    def read_path(self, path):
+        is_fifo = stat.S_ISFIFO(os.stat(path).st_mode)
+        while not self.buffer.closed:
+            with open(path, 'rb') as f:
+                self.read_lines(f)
+            if not is_fifo:
+                return
+
+    def serve_socket(self, port):
+        with socket.create_server(("127.0.0.1", port)) as server:
+            while not self.buffer.closed:
+                connection, _ = server.accept()
+                with connection, connection.makefile('rb') as f:
+                    self.read_lines(f)
+
+class StreamWordManager(WordManager):
+    """以流式输入为词库的 WordManager
+
+    只保留正在显示的词条，不读取 resources 目录，也不保存进度。
+    """
+
+    def __init__(self, source, buffer_size=DEFAULT_BUFFER_SIZE, policy="drop", config_path=None):
+        super().__init__(config_path)
+        self.buffer = StreamBuffer(buffer_size, policy)
+        self.reader = StreamReader(source, self.buffer, self.parse_word_line)
+        self.received = 0
+
+    def load_all_vocabulary(self, resources_dir=None):
+        if not self.reader.thread.is_alive() and not self.reader.finished:
+            self.reader.start()
+        self.vocabulary = [("等待输入…", "")]
+        self.current_index = 0
+        self.is_loaded = True
+        return True
+
+    def get_next_word(self):
+        """取出下一个词条，没有新输入时保持当前词条"""
+        entry = self.buffer.get_nowait()
+        if entry is not None:
+            self.vocabulary[0] = entry
+            self.received += 1
+
+    def save_progress(self, force=False):
+        pass
+
+    def switch_to_file(self, file_index):
+        return False
+
+    def seek(self, global_index):
+        return False
+
+    def set_word_weight(self, index, weight):
+        pass
+
+    def toggle_hard_word(self, index=None):
+        return False
+
+    def get_global_position(self):
+        """(已显示的词条数 - 1, 已显示和缓冲中的词条总数)"""
+        return max(0, self.received - 1), self.received + len(self.buffer)
+
+    def get_current_file_name(self):
+        return self.reader.describe()
+
+    def close(self):
+        self.buffer.close()
+        super().close()
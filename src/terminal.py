@@ -0,0 +1,228 @@
+import contextlib
+import curses
+import io
+import locale
+import time
+import unicodedata
+from word_manager import WordManager, SCROLL_MODES
+from word_order import ORDER_VIEWS
+
+# 终端前端：只依赖 WordManager，不导入 PySide6，适用于无图形界面或 SSH 环境
+
+HELP_TEXT = "空格 暂停  ←/→ 后退/前进  [ ] 切换单词本  m 模式  o 顺序  h 难词  +/- 间隔  q 退出"
+
+def display_width(text):
+    """计算字符串在终端中的显示宽度（中文等宽字符占两列）"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1 for ch in text)
+
+def clip_to_width(text, width):
+    """按显示宽度截断字符串"""
+    result = []
+    used = 0
+    for ch in text:
+        w = 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+        if used + w > width:
+            break
+        result.append(ch)
+        used += w
+    return "".join(result)
+
+class TerminalScroller:
+    """终端单词滚动显示器"""
+
+    def __init__(self, word_manager):
+        self.word_manager = word_manager
+        self.stdscr = None
+        self.running = True
+        self.paused = False
+        self.current_word = ""
+        self.current_meaning = ""
+        self.message = ""
+        self.position = (0, 0)  # 正在显示的单词在所有单词本中的位置 (位置, 总数)
+        self.word_index = None  # 正在显示的单词 (单词本索引, 行号)
+        self.interval_changed = False
+        self.load_settings()
+        self.word_manager.set_file_changed_callback(self.render)
+
+    def load_settings(self):
+        """加载设置"""
+        self.scroll_mode = self.word_manager.get_config("app", "default_scroll_mode", "下一文件")
+        self.interval = self.word_manager.get_config("app", "default_interval", 3)
+
+    def run(self):
+        locale.setlocale(locale.LC_ALL, "")  # 让 curses 正确输出中文
+        # WordManager 的日志输出会破坏 curses 画面，先暂存，退出后再打印
+        log = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(log):
+                curses.wrapper(self._main)
+        finally:
+            self.word_manager.close()
+            print(log.getvalue(), end="")
+
+    def _main(self, stdscr):
+        self.stdscr = stdscr
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+        if not self.word_manager.load_all_vocabulary():
+            self.current_word = "没有找到词库文件！"
+            self.render()
+            stdscr.timeout(-1)
+            stdscr.getch()
+            return
+
+        # 首次启动时立即显示当前单词和释义
+        self.position = self.word_manager.get_global_position()
+        self.word_index = (self.word_manager.current_file_index, self.word_manager.current_index)
+        self.current_word, self.current_meaning = self.word_manager.get_current_word()
+        self.render()
+
+        # 以单调时钟为基准计算下一次切换时间，避免等待按键造成的误差累积
+        next_tick = time.monotonic() + self.interval
+        while self.running:
+            timeout_ms = max(0, int((next_tick - time.monotonic()) * 1000))
+            stdscr.timeout(timeout_ms)
+            key = stdscr.getch()
+            if key != -1:
+                self.handle_key(key)
+                if self.interval_changed:
+                    next_tick = time.monotonic() + self.interval
+                continue
+            now = time.monotonic()
+            if now < next_tick:
+                continue
+            if not self.paused:
+                self.next_word()
+            next_tick += self.interval
+            if next_tick <= now:
+                next_tick = now + self.interval
+
+    def next_word(self):
+        """显示当前单词并推进到下一个（与图形界面的切换顺序一致）"""
+        if not self.word_manager.is_loaded:
+            return
+        self.position = self.word_manager.get_global_position()
+        self.word_index = (self.word_manager.current_file_index, self.word_manager.current_index)
+        self.current_word, self.current_meaning = self.word_manager.get_current_word()
+        self.word_manager.get_next_word()
+        if not self.paused:
+            self.message = ""
+        self.render()
+
+    def switch_file(self, step):
+        """切换到相邻的单词本"""
+        files = self.word_manager.files
+        if not files:
+            return
+        file_index = (self.word_manager.current_file_index + step) % len(files)
+        if self.word_manager.switch_to_file(file_index):
+            self.position = self.word_manager.get_global_position()
+            self.word_index = (self.word_manager.current_file_index, self.word_manager.current_index)
+            self.current_word, self.current_meaning = self.word_manager.get_current_word()
+            self.message = f"已切换到单词本：{self.word_manager.get_current_file_name()}"
+        self.render()
+
+    def cycle_scroll_mode(self):
+        """循环切换滚动模式"""
+        index = SCROLL_MODES.index(self.scroll_mode) if self.scroll_mode in SCROLL_MODES else -1
+        self.scroll_mode = SCROLL_MODES[(index + 1) % len(SCROLL_MODES)]
+        self.word_manager.set_config("app", "default_scroll_mode", self.scroll_mode)
+        self.message = f"滚动模式：{self.scroll_mode}"
+        self.render()
+
+    def toggle_hard_word(self):
+        """标记/取消标记正在显示的单词为难词"""
+        if self.word_index is None or self.word_index[0] != self.word_manager.current_file_index:
+            return
+        is_hard = self.word_manager.toggle_hard_word(self.word_index[1])
+        self.message = f"已标记为难词：{self.current_word}" if is_hard else f"已取消难词标记：{self.current_word}"
+        self.render()
+
+    def cycle_order_view(self):
+        """循环切换排列视图，当前单词保持不变"""
+        view = self.word_manager.get_order_view()
+        self.word_manager.set_order_view(ORDER_VIEWS[(ORDER_VIEWS.index(view) + 1) % len(ORDER_VIEWS)])
+        self.message = f"顺序：{self.word_manager.get_order_view()}"
+        self.render()
+
+    def change_interval(self, delta):
+        """调整切换间隔（0.1秒到100秒）"""
+        self.interval = round(min(100.0, max(0.1, self.interval + delta)), 1)
+        self.word_manager.set_config("app", "default_interval", self.interval)
+        self.interval_changed = True
+        self.message = f"切换间隔：{self.interval} 秒"
+        self.render()
+
+    def handle_key(self, key):
+        """键盘事件处理"""
+        self.interval_changed = False
+        if key in (ord('q'), ord('Q'), 27):
+            self.running = False
+        elif key == ord(' '):
+            self.paused = not self.paused
+            self.message = "已暂停" if self.paused else ""
+            self.render()
+        elif key in (ord('n'), curses.KEY_RIGHT):
+            self.next_word()
+        elif key in (ord('p'), curses.KEY_LEFT):
+            if self.word_manager.is_loaded and self.word_manager.history_back():
+                self.next_word()
+        elif key == ord(']'):
+            self.switch_file(1)
+        elif key == ord('['):
+            self.switch_file(-1)
+        elif key in (ord('m'), ord('M')):
+            self.cycle_scroll_mode()
+        elif key in (ord('h'), ord('H')):
+            self.toggle_hard_word()
+        elif key in (ord('o'), ord('O')):
+            self.cycle_order_view()
+        elif key in (ord('+'), ord('=')):
+            self.change_interval(0.5)
+        elif key == ord('-'):
+            self.change_interval(-0.5)
+        elif key == curses.KEY_RESIZE:
+            self.render()
+
+    def render(self):
+        """绘制单词、释义和状态栏"""
+        if self.stdscr is None:
+            return
+        self.stdscr.erase()
+        height, width = self.stdscr.getmaxyx()
+        title = f"滚动显示器  （单词本: {self.word_manager.get_current_file_name()}）"
+        status = (f"{self.position[0] + 1}/{self.position[1]}"
+                  f"  {self.scroll_mode}  {self.word_manager.get_order_view()}  {self.interval}秒")
+        middle = height // 2
+        self._draw_line(0, title, curses.A_BOLD)
+        self._draw_centered(middle - 1, self.current_word, curses.A_BOLD)
+        self._draw_centered(middle + 1, self.current_meaning)
+        self._draw_line(height - 2, self.message or status)
+        self._draw_line(height - 1, HELP_TEXT, curses.A_DIM)
+        self.stdscr.refresh()
+
+    def _draw_centered(self, y, text, attr=0):
+        height, width = self.stdscr.getmaxyx()
+        text = clip_to_width(text, width - 1)
+        x = max(0, (width - display_width(text)) // 2)
+        self._addstr(y, x, text, attr)
+
+    def _draw_line(self, y, text, attr=0):
+        height, width = self.stdscr.getmaxyx()
+        self._addstr(y, 0, clip_to_width(text, width - 1), attr)
+
+    def _addstr(self, y, x, text, attr):
+        height, width = self.stdscr.getmaxyx()
+        if not 0 <= y < height:
+            return
+        try:
+            self.stdscr.addstr(y, x, text, attr)
+        except curses.error:
+            pass
+
+def run_terminal(word_manager=None):
+    if word_manager is None:
+        word_manager = WordManager()
+    TerminalScroller(word_manager).run()
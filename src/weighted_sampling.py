@@ -0,0 +1,156 @@
+import os
+import json
+import random
+import itertools
+from array import array
+
+# 加权随机抽样：Walker/Vose 别名表，每次抽样 O(1)
+# 权重按块分组，修改单个权重只让所在块和块间的别名表失效，下次抽样时再重建
+
+DEFAULT_WEIGHT = 1.0
+HARD_WEIGHT = 4.0  # 标记为难词后的权重
+BLOCK_SIZE = 1024
+WEIGHTS_SUFFIX = ".weights"
+
+class AliasTable:
+    """Vose 别名表"""
+
+    def __init__(self, weights):
+        n = len(weights)
+        self.size = n
+        self.prob = array('d', bytes(8 * n))
+        self.alias = array('I', bytes(4 * n))
+        total = sum(weights)
+        if n == 0 or total <= 0:
+            # 权重全为0时退化为均匀抽样
+            for i in range(n):
+                self.prob[i] = 1.0
+            return
+        scaled = array('d', (w * n / total for w in weights))
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # 剩余项由于浮点误差可能略小于1，按1处理
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        i = int(rng.random() * self.size)
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+class WeightedSampler:
+    """分块别名表：先按块权重抽块，再在块内抽样
+
+    修改单个权重的代价是 O(1)，失效的块表和块间表在下一次抽样时重建，
+    重建代价为 O(BLOCK_SIZE + 块数)。
+    """
+
+    def __init__(self, weights, block_size=BLOCK_SIZE):
+        self.weights = array('d', weights)
+        self.block_size = block_size
+        block_count = (len(self.weights) + block_size - 1) // block_size
+        self.block_sums = array('d', (sum(self.weights[b * block_size:(b + 1) * block_size])
+                                      for b in range(block_count)))
+        self.block_tables = [None] * block_count
+        self.top_table = None
+
+    def __len__(self):
+        return len(self.weights)
+
+    def set_weight(self, index, weight):
+        block = index // self.block_size
+        self.block_sums[block] += weight - self.weights[index]
+        self.weights[index] = weight
+        self.block_tables[block] = None
+        self.top_table = None
+
+    def sample(self, rng=random):
+        if not self.weights:
+            return -1
+        if self.top_table is None:
+            self.top_table = AliasTable(self.block_sums)
+        block = self.top_table.sample(rng)
+        table = self.block_tables[block]
+        if table is None:
+            start = block * self.block_size
+            table = self.block_tables[block] = AliasTable(self.weights[start:start + self.block_size])
+        return block * self.block_size + table.sample(rng)
+
+def get_weights_path(book_path):
+    """权重文件与词库文件放在一起，如 words.txt -> words.txt.weights"""
+    return book_path + WEIGHTS_SUFFIX
+
+def load_weights(book_path):
+    """读取单词本的权重 {单词: 权重}。按单词保存，单词本增删行后依然有效"""
+    weights_path = get_weights_path(book_path)
+    if not os.path.exists(weights_path):
+        return {}
+    try:
+        with open(weights_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading weights {weights_path}: {e}")
+        return {}
+
+def save_weights(book_path, weights):
+    weights_path = get_weights_path(book_path)
+    try:
+        with open(weights_path, 'w', encoding='utf-8') as f:
+            json.dump(weights, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"Error saving weights {weights_path}: {e}")
+
+def benchmark(n=1000000, samples=1000000, updates=1000):
+    """与 random.choices 比较抽样吞吐量和重建代价"""
+    import time
+    weights = [random.random() + 0.01 for _ in range(n)]
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    sampler = WeightedSampler(weights)
+    sampler.sample(rng)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(samples):
+        sampler.sample(rng)
+    alias_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(updates):
+        sampler.set_weight(rng.randrange(n), rng.random())
+        sampler.sample(rng)
+    update_time = time.perf_counter() - start
+
+    # random.choices 每次调用都要重新累加权重（O(n)），只测少量次数
+    naive_samples = max(1, samples // 10000)
+    start = time.perf_counter()
+    for _ in range(naive_samples):
+        rng.choices(range(n), weights)
+    naive_time = time.perf_counter() - start
+
+    # 预先计算 cum_weights 时 random.choices 每次抽样是 O(log n)
+    cum_weights = list(itertools.accumulate(weights))
+    start = time.perf_counter()
+    rng.choices(range(n), cum_weights=cum_weights, k=samples)
+    cum_time = time.perf_counter() - start
+
+    print(f"n={n}")
+    print(f"  alias build:           {build_time * 1000:.1f} ms")
+    print(f"  alias sample:          {samples / alias_time:,.0f} samples/s")
+    print(f"  update + sample:       {update_time / updates * 1e6:.1f} us each")
+    print(f"  random.choices:        {naive_samples / naive_time:,.0f} samples/s")
+    print(f"  random.choices (cum):  {samples / cum_time:,.0f} samples/s")
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
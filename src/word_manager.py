@@ -1,6 +1,12 @@
 import os
 import json
 import sys
+import time
+from word_order import WordOrder, DEFAULT_ORDER_VIEW
+from library import Library
+from book_cache import BookCache, DEFAULT_MAX_BYTES
+from history import NavigationHistory, DEFAULT_CAPACITY
+from weighted_sampling import WeightedSampler, DEFAULT_WEIGHT, HARD_WEIGHT, load_weights, save_weights
 
 def get_base_dir():
     if getattr(sys, 'frozen', False):
@@ -8,6 +14,10 @@ def get_base_dir():
     else:
         return os.path.dirname(os.path.abspath(__file__))
 
+# 滚动模式（界面与终端前端共用）
+SCROLL_MODES = ["播完停止", "文件内循环", "下一文件", "加权随机"]
+PROGRESS_SAVE_INTERVAL = 5.0  # 自动切换时进度最多每5秒写一次配置文件
+
 class WordManager:
     def __init__(self, config_path=None):
         base_dir = get_base_dir()
@@ -21,6 +31,17 @@ class WordManager:
         self.on_file_changed_callback = None  # 文件切换回调函数
         self.config_path = config_path
         self.config = self.load_config()
+        self.progress_saved_at = time.monotonic()  # 上次把进度写入配置文件的时间
+        self.word_order = WordOrder()  # 排列视图（字母顺序、按长度、按难度）
+        self.word_order.set_view(self.get_config("app", "default_order_view", DEFAULT_ORDER_VIEW))
+        self.word_weights = {}  # 当前单词本的单词权重 {单词: 权重}，只保存非默认值
+        self.sampler = None  # 加权随机模式的抽样器，首次使用时构建
+        # 已解析单词本的 LRU 缓存，切换单词本时不必重新读取文件
+        self.book_cache = BookCache(self.get_config("cache", "max_bytes", DEFAULT_MAX_BYTES))
+        # 显示过的单词位置，用于后退/前进
+        self.history = NavigationHistory(self.get_config("cache", "history_size", DEFAULT_CAPACITY))
+        # 所有单词本组成的全局序列（只记录词条数，不加载内容）
+        self.library = Library(os.path.join(os.path.dirname(config_path), "library.json"))
 
     def load_config(self):
         if os.path.exists(self.config_path):
@@ -33,7 +54,7 @@ class WordManager:
             json.dump(self.config, f, ensure_ascii=False, indent=2)
 
     def get_config(self, section, key, default=None):
-        self.load_config()
+        # 读取内存中的配置；其他地方修改配置文件后需调用 load_config 刷新
         return self.config.get(section, {}).get(key, default)
 
     def set_config(self, section, key, value):
@@ -42,10 +63,30 @@ class WordManager:
         self.config[section][key] = value
         self.save_config()
 
+    def get_resources_dir(self):
+        return os.path.join(get_base_dir(), "resources")
+
+    def list_vocabulary_files(self, resources_dir=None):
+        """递归扫描词库目录，返回所有txt文件的完整路径，同时刷新单词本目录的元数据"""
+        if resources_dir is None:
+            resources_dir = self.get_resources_dir()
+        return self.library.scan(resources_dir)
+
+    def refresh_catalog(self):
+        """重新扫描词库目录，当前单词本按路径重新定位；当前单词本已被删除时重新加载"""
+        if not self.is_loaded or not self.files:
+            return self.load_all_vocabulary()
+        current_path = self.files[self.current_file_index]
+        self.files = self.list_vocabulary_files()
+        if current_path not in self.files:
+            return self.load_all_vocabulary()
+        self.current_file_index = self.files.index(current_path)
+        return True
+
     def load_all_vocabulary(self, resources_dir=None):
         if resources_dir is None:
-            resources_dir = os.path.join(get_base_dir(), "resources")
-        self.vocabulary.clear()
+            resources_dir = self.get_resources_dir()
+        self.vocabulary = []
         self.current_index = 0
         self.is_loaded = False
         self.files = []
@@ -53,27 +94,24 @@ class WordManager:
             print(f"Error: Resources directory not found at {resources_dir}")
             return False
         try:
-            for filename in os.listdir(resources_dir):
-                if filename.endswith('.txt'):
-                    file_path = os.path.join(resources_dir, filename)
-                    self.files.append(file_path)
+            self.files = self.list_vocabulary_files(resources_dir)
             if not self.files:
                 print("No .txt files found in resources directory")
                 return False
-            self.load_progress()
-            for file_path in self.files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                word, meaning = self.parse_word_line(line)
-                                self.vocabulary.append((word, meaning))
-                except Exception as e:
-                    print(f"Error loading file {file_path}: {e}")
+            if self.library.total == 0:
+                print("No words found in any files")
+                return False
+            # 只加载当前显示的单词本，其余单词本只用缓存的词条数参与全局位置计算
+            saved_index = self.load_progress()
+            if not self.library.book_count(self.current_file_index):
+                self.current_file_index = self.library.locate(0)[0]
+                saved_index = 0
+            self.load_current_file()
             if self.vocabulary:
+                self.current_index = min(saved_index, len(self.vocabulary) - 1)
                 self.is_loaded = True
-                print(f"Successfully loaded {len(self.vocabulary)} words from {len(self.files)} files.")
+                print(f"Successfully loaded {len(self.vocabulary)} words, "
+                      f"{self.library.total} words in {len(self.files)} files.")
                 return True
             else:
                 print("No words found in any files")
@@ -85,20 +123,38 @@ class WordManager:
     def load_vocabulary(self, file_path=None):
         return self.load_all_vocabulary()
 
-    def save_progress(self):
+    def save_progress(self, force=False):
+        """记录进度。每次切换只修改内存中的配置，force 为 True 或距上次写入超过 PROGRESS_SAVE_INTERVAL 时才写入文件"""
+        # current_index 是当前单词本内的行号，total_words 是所有单词本的词条总数
         if self.is_loaded and self.vocabulary:
-            self.set_config("app", "current_index", self.current_index)
-            self.set_config("app", "current_file_index", self.current_file_index)
-            self.set_config("app", "total_words", len(self.vocabulary))
+            app_config = self.config.setdefault("app", {})
+            app_config["current_index"] = self.current_index
+            app_config["current_file_index"] = self.current_file_index
+            app_config["current_file_name"] = self.get_current_file_name()
+            app_config["total_words"] = self.library.total
+            self.library.set_position(self.current_file_index, self.current_index)
+            now = time.monotonic()
+            if force or now - self.progress_saved_at >= PROGRESS_SAVE_INTERVAL:
+                self.save_config()
+                self.library.flush()
+                self.progress_saved_at = now
 
     def load_progress(self):
+        """恢复上次的单词本，返回上次在该单词本内的行号"""
         saved_index = self.get_config("app", "current_index", 0)
         saved_file_index = self.get_config("app", "current_file_index", 0)
-        saved_total = self.get_config("app", "total_words", 0)
-        if saved_total > 0:
-            self.current_index = min(saved_index, saved_total - 1)
-            self.current_file_index = min(saved_file_index, len(self.files) - 1) if self.files else 0
-            print(f"Restored progress: word {self.current_index + 1}/{saved_total}")
+        saved_file_name = self.get_config("app", "current_file_name", "")
+        # 优先按文件名恢复，单词本增删后文件索引可能已经变化
+        file_index = self.find_file_index(saved_file_name) if saved_file_name else -1
+        if file_index == -1:
+            if saved_file_name:
+                saved_index = 0  # 上次的单词本已经不存在
+            file_index = min(saved_file_index, len(self.files) - 1) if self.files else 0
+        self.current_file_index = max(0, file_index)
+        saved_index = max(0, min(saved_index, self.library.book_count(self.current_file_index) - 1))
+        global_index = self.library.offset(self.current_file_index) + saved_index
+        print(f"Restored progress: word {global_index + 1}/{self.library.total}")
+        return saved_index
 
     def get_current_word(self):
         if not self.is_loaded or not self.vocabulary:
@@ -109,39 +165,201 @@ class WordManager:
         if not self.is_loaded or not self.vocabulary:
             return
         self.save_progress()
+        # 记录刚显示的单词；后退之后按历史记录前进，直到回到最新的位置
+        self.history.visit(self.get_location())
+        forward = self.history.peek_forward()
+        if forward is not None and self.go_to_location(forward):
+            return
         scroll_mode = self.get_config("app", "default_scroll_mode", "下一文件")
-        if scroll_mode == "播完停止":
-            if self.current_index < len(self.vocabulary) - 1:
-                self.current_index += 1
-            else:
+        # 按当前视图中的位置前进，vocabulary 本身不复制也不重排
+        position = self.word_order.position(self.current_index)
+        if scroll_mode == "加权随机":
+            # 在当前单词本内按权重随机抽取，标记为难词的单词出现得更频繁
+            if self.sampler is None:
+                self.sampler = WeightedSampler(self.word_weights.get(word, DEFAULT_WEIGHT)
+                                               for word, meaning in self.vocabulary)
+            self.current_index = self.sampler.sample()
+        elif position + 1 < len(self.vocabulary):
+            self.current_index = self.word_order.index_at(position + 1)
+        elif scroll_mode == "播完停止":
+            # 所有单词本都播完才停止
+            next_file_index = self.find_next_nonempty_file(self.current_file_index, wrap=False)
+            if next_file_index == -1:
                 return
+            self.load_file_at(next_file_index)
         elif scroll_mode == "文件内循环":
-            self.current_index = (self.current_index + 1) % len(self.vocabulary)
+            self.current_index = self.word_order.index_at(0)
         elif scroll_mode == "下一文件":
-            self.current_index += 1
-            if self.current_index >= len(self.vocabulary):
-                self.current_file_index = (self.current_file_index + 1) % len(self.files)
-                self.current_index = 0
-                self.load_current_file()
+            self.load_file_at(self.find_next_nonempty_file(self.current_file_index, wrap=True))
+
+    def find_next_nonempty_file(self, file_index, wrap=True):
+        """查找下一本非空单词本，wrap 为 False 时到最后一本为止，找不到返回-1"""
+        count = len(self.files)
+        for step in range(1, count + 1):
+            next_index = file_index + step
+            if next_index >= count:
+                if not wrap:
+                    return -1
+                next_index %= count
+            if self.library.book_count(next_index):
+                return next_index
+        return -1
+
+    def load_file_at(self, file_index, position=0):
+        """加载指定单词本，并定位到当前视图中的第 position 个词条"""
+        if file_index != self.current_file_index or not self.vocabulary:
+            self.current_file_index = file_index
+            self.load_current_file()
+        if self.vocabulary:
+            self.current_index = self.word_order.index_at(min(position, len(self.vocabulary) - 1))
+        else:
+            self.current_index = 0
+
+    def get_word_weight(self, index=None):
+        if not self.vocabulary:
+            return DEFAULT_WEIGHT
+        index = self.current_index if index is None else index
+        return self.word_weights.get(self.vocabulary[index][0], DEFAULT_WEIGHT)
+
+    def set_word_weight(self, index, weight):
+        """修改单词的权重并保存，权重按单词保存，同一单词本中同名的词条共用权重"""
+        if not self.vocabulary or not 0 <= index < len(self.vocabulary):
+            return
+        word = self.vocabulary[index][0]
+        if weight == DEFAULT_WEIGHT:
+            self.word_weights.pop(word, None)
+        else:
+            self.word_weights[word] = weight
+        if self.sampler is not None:
+            # 只更新这一个词条（O(1)），同名词条在下次加载单词本时生效
+            self.sampler.set_weight(index, weight)
+        save_weights(self.files[self.current_file_index], self.word_weights)
+
+    def toggle_hard_word(self, index=None):
+        """标记/取消标记难词，返回标记后是否为难词"""
+        index = self.current_index if index is None else index
+        is_hard = self.get_word_weight(index) == DEFAULT_WEIGHT
+        self.set_word_weight(index, HARD_WEIGHT if is_hard else DEFAULT_WEIGHT)
+        return is_hard
+
+    def get_location(self):
+        """当前位置 (单词本路径, 行号)"""
+        return self.files[self.current_file_index], self.current_index
+
+    def go_to_location(self, location):
+        """跳转到历史记录中的位置，单词本已不存在时返回 False"""
+        file_path, index = location
+        if self.current_file_index < len(self.files) and self.files[self.current_file_index] == file_path:
+            file_index = self.current_file_index
+        elif file_path in self.files:
+            file_index = self.files.index(file_path)
+        else:
+            return False
+        if file_index != self.current_file_index or not self.vocabulary:
+            self.current_file_index = file_index
+            self.load_current_file()
+        if not self.vocabulary:
+            return False
+        self.current_index = min(index, len(self.vocabulary) - 1)
+        return True
+
+    def history_back(self):
+        """后退到上一个显示过的单词（需要先显示它，再调用 get_next_word）"""
+        while self.history.can_back():
+            if self.go_to_location(self.history.back()):
+                return True
+        return False
+
+    def get_global_position(self):
+        """返回 (当前单词在所有单词本中的位置, 词条总数)，位置从0开始"""
+        position = self.word_order.position(self.current_index) if self.vocabulary else 0
+        return self.library.offset(self.current_file_index) + position, self.library.total
+
+    def seek(self, global_index):
+        """跳转到所有单词本中的第 global_index 个词条，只加载目标单词本"""
+        if not self.is_loaded or not self.library.total:
+            return False
+        file_index, position = self.library.locate(global_index)
+        self.load_file_at(file_index, position)
+        self.save_progress(force=True)
+        return True
+
+    def set_order_view(self, view):
+        """切换排列视图，当前单词保持不变"""
+        self.word_order.set_view(view)
+        self.set_config("app", "default_order_view", self.word_order.view)
+
+    def get_order_view(self):
+        return self.word_order.view
 
     def load_current_file(self):
         if not self.files:
             return
-        self.vocabulary.clear()
+        self.vocabulary = []
         file_path = self.files[self.current_file_index]
+        # 记录最近打开时间，随进度一起写入 library.json
+        self.library.mark_opened(self.current_file_index)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        word, meaning = self.parse_word_line(line)
-                        self.vocabulary.append((word, meaning))
+            # 从缓存取已解析的单词本，文件未修改时不会重新读取
+            book = self.book_cache.get(file_path, self.read_book)
+            self.vocabulary = book.entries
+            self.library.update_count(self.current_file_index, len(self.vocabulary))
+            if book.weights is None:
+                # 权重随单词本一起缓存，set_word_weight 直接修改这个字典，切换回来时不必重新读取权重文件
+                book.weights = load_weights(file_path)
+                self.book_cache.add_bytes(file_path, sys.getsizeof(book.weights))
+            self.word_weights = book.weights
+            self.sampler = None
+            if book.views is None:
+                self.word_order.build(self.vocabulary, file_path)
+                book.views = self.word_order.views
+                self.book_cache.add_bytes(file_path, sum(sys.getsizeof(order) + sys.getsizeof(rank)
+                                                         for order, rank in book.views.values()))
+            else:
+                self.word_order.views = book.views
             print(f"Loaded file: {os.path.basename(file_path)} ({len(self.vocabulary)} words)")
             if self.on_file_changed_callback:
                 self.on_file_changed_callback()
         except Exception as e:
+            self.word_order.clear()
             print(f"Error loading current file: {e}")
 
+    def switch_to_file(self, file_index):
+        """切换到指定索引的词库文件，并从文件开头开始"""
+        if not self.files or not 0 <= file_index < len(self.files):
+            return False
+        self.current_file_index = file_index
+        self.current_index = 0  # 重置到文件开头
+        self.load_current_file()
+        self.current_index = self.word_order.index_at(0)
+        self.save_progress(force=True)
+        return True
+
+    def find_file_index(self, filename):
+        """根据文件名（相对词库目录的路径或文件名）查找词库文件索引，找不到返回-1"""
+        for i in range(len(self.files)):
+            if self.library.get_name(i) == filename:
+                return i
+        for i, path in enumerate(self.files):
+            if os.path.basename(path) == filename:
+                return i
+        return -1
+
+    def close(self):
+        """退出前保存进度和单词本目录中尚未写入的元数据"""
+        self.save_progress(force=True)
+        self.library.flush()  # 未加载单词本时 save_progress 不会保存
+
+    def read_book(self, file_path):
+        """读取并解析一本单词本，返回 [(word, meaning), ...]，不改变当前状态"""
+        entries = []
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(self.parse_word_line(line))
+        return entries
+
     def set_file_changed_callback(self, callback):
         self.on_file_changed_callback = callback
 
@@ -166,5 +384,5 @@ class WordManager:
     def get_current_file_name(self):
         # 修复：确保索引有效且files不为空
         if self.files and 0 <= self.current_file_index < len(self.files):
-            return os.path.basename(self.files[self.current_file_index])
+            return self.library.get_name(self.current_file_index)
         return "Unknown"
@@ -0,0 +1,122 @@
+import os
+import json
+from array import array
+
+# 单词排列顺序（视图）。视图只是索引数组，不会复制或重排 vocabulary
+ORDER_VIEWS = ["文件顺序", "字母顺序", "按长度", "按难度"]
+DEFAULT_ORDER_VIEW = "文件顺序"
+CACHE_SUFFIX = ".order"
+
+def difficulty_score(word, meaning):
+    """估算单词难度：单词越长、释义义项越多越难"""
+    senses = sum(1 for part in meaning.replace(';', '；').split('；') if part.strip())
+    return len(word) + 2 * senses
+
+def alphabetical_key(entry):
+    return entry[0].casefold()
+
+def length_key(entry):
+    return len(entry[0]), entry[0].casefold()
+
+def difficulty_key(entry):
+    return -difficulty_score(entry[0], entry[1]), entry[0].casefold()
+
+SORT_KEYS = {
+    "字母顺序": alphabetical_key,
+    "按长度": length_key,
+    "按难度": difficulty_key,
+}
+
+def get_cache_path(book_path):
+    """缓存文件与词库文件放在一起，如 words.txt -> words.txt.order"""
+    return book_path + CACHE_SUFFIX
+
+class WordOrder:
+    """vocabulary 上的排列视图
+
+    每个视图保存两个 array('I')：order[位置] = vocabulary 下标，rank[vocabulary 下标] = 位置。
+    vocabulary 只包含当前单词本，排序结果缓存在磁盘上，只有修改过的单词本才会重新排序。
+    """
+
+    def __init__(self):
+        self.view = DEFAULT_ORDER_VIEW
+        self.views = {}  # 视图名 -> (order, rank)
+
+    def build(self, vocabulary, path):
+        """为已加载的单词本 vocabulary（文件 path）构建所有视图"""
+        self.views = {}
+        book_orders = self._load_book_orders(vocabulary, path)
+        for view in SORT_KEYS:
+            order = book_orders[view]
+            rank = array('I', bytes(4 * len(order)))
+            for position, index in enumerate(order):
+                rank[index] = position
+            self.views[view] = (order, rank)
+
+    def clear(self):
+        """丢弃已构建的视图，退回文件顺序"""
+        self.views = {}
+
+    def set_view(self, view):
+        """切换视图，只修改当前视图名，不会重新排序"""
+        self.view = view if view in ORDER_VIEWS else DEFAULT_ORDER_VIEW
+
+    def position(self, index):
+        """vocabulary 下标在当前视图中的位置"""
+        if self.view == DEFAULT_ORDER_VIEW or self.view not in self.views:
+            return index
+        return self.views[self.view][1][index]
+
+    def index_at(self, position):
+        """当前视图中第 position 个词条对应的 vocabulary 下标"""
+        if self.view == DEFAULT_ORDER_VIEW or self.view not in self.views:
+            return position
+        return self.views[self.view][0][position]
+
+    def _load_book_orders(self, vocabulary, path):
+        """读取单词本的视图缓存，缓存失效时重新排序并写回"""
+        count = len(vocabulary)
+        try:
+            stat = os.stat(path)
+            stamp = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "count": count}
+        except OSError:
+            stamp = None
+        if stamp is not None:
+            orders = self._read_cache(path, stamp)
+            if orders is not None:
+                return orders
+        orders = {view: array('I', sorted(range(count), key=lambda i: key(vocabulary[i])))
+                  for view, key in SORT_KEYS.items()}
+        if stamp is not None:
+            self._write_cache(path, stamp, orders)
+        return orders
+
+    def _read_cache(self, path, stamp):
+        cache_path = get_cache_path(path)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                if header.get("stamp") != stamp or header.get("views") != list(SORT_KEYS):
+                    return None
+                orders = {}
+                for view in header["views"]:
+                    order = array('I')
+                    order.fromfile(f, stamp["count"])
+                    orders[view] = order
+                return orders
+        except Exception as e:
+            print(f"Error reading order cache {cache_path}: {e}")
+            return None
+
+    def _write_cache(self, path, stamp, orders):
+        cache_path = get_cache_path(path)
+        header = {"stamp": stamp, "views": list(orders)}
+        try:
+            with open(cache_path, 'wb') as f:
+                f.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b"\n")
+                for order in orders.values():
+                    order.tofile(f)
+        except Exception as e:
+            print(f"Error writing order cache {cache_path}: {e}")
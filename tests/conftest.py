@@ -0,0 +1,5 @@
+import os
+import sys
+
+# src 下的模块按顶层模块导入（与 main.py 相同）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
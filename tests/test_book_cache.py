@@ -0,0 +1,57 @@
+import os
+from book_cache import BookCache, entries_bytes
+
+def make_book(tmp_path, name, count):
+    path = tmp_path / name
+    path.write_text("".join(f"w{i}\n" for i in range(count)), encoding="utf-8")
+    return str(path)
+
+def loader(path):
+    with open(path, encoding="utf-8") as f:
+        return [(line.strip(), "") for line in f]
+
+def test_hits_misses_and_lru_eviction(tmp_path):
+    a, b, c = (make_book(tmp_path, name, 20) for name in ("a.txt", "b.txt", "c.txt"))
+    book_bytes = entries_bytes(loader(a))
+    cache = BookCache(max_bytes=book_bytes * 2)
+    cache.get(a, loader)
+    cache.get(b, loader)
+    assert cache.get(a, loader) is cache.books[a]  # a 变为最近使用
+    cache.get(c, loader)  # 超出上限，淘汰最久未使用的 b
+    assert list(cache.books) == [a, c]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+    assert stats["bytes"] == book_bytes * 2
+    cache.get(b, loader)
+    assert list(cache.books) == [c, b]
+    assert cache.stats()["misses"] == 4
+
+def test_keeps_most_recent_book_over_limit(tmp_path):
+    a = make_book(tmp_path, "a.txt", 50)
+    cache = BookCache(max_bytes=1)
+    cache.get(a, loader)
+    assert list(cache.books) == [a]
+    assert cache.evictions == 0
+
+def test_modified_book_is_reloaded(tmp_path):
+    a = make_book(tmp_path, "a.txt", 5)
+    cache = BookCache()
+    first = cache.get(a, loader)
+    make_book(tmp_path, "a.txt", 7)
+    stat = os.stat(a)
+    os.utime(a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    second = cache.get(a, loader)
+    assert second is not first
+    assert len(second.entries) == 7
+    assert cache.total_bytes == second.nbytes
+    assert cache.misses == 2
+
+def test_add_bytes_counts_towards_limit(tmp_path):
+    a, b = make_book(tmp_path, "a.txt", 10), make_book(tmp_path, "b.txt", 10)
+    book_bytes = entries_bytes(loader(a))
+    cache = BookCache(max_bytes=book_bytes * 2 + 10)
+    cache.get(a, loader)
+    cache.get(b, loader)
+    cache.add_bytes(b, 100)
+    assert list(cache.books) == [b]
+    assert cache.total_bytes == book_bytes + 100
@@ -0,0 +1,56 @@
+from history import NavigationHistory
+
+def test_ring_wraps_and_keeps_newest():
+    history = NavigationHistory(3)
+    for location in range(5):
+        history.visit(location)
+    assert history.length == 3
+    assert history.back() == 3
+    assert history.back() == 2
+    assert not history.can_back()
+    assert history.back() is None
+
+def test_back_then_forward():
+    history = NavigationHistory(10)
+    for location in "abcd":
+        history.visit(location)
+    assert history.back() == "c"
+    assert history.back() == "b"
+    assert history.peek_forward() == "c"
+    # 按历史前进时只移动游标，不丢弃前进方向的记录
+    history.visit("c")
+    assert history.peek_forward() == "d"
+    history.visit("d")
+    assert history.peek_forward() is None
+    assert history.length == 4
+
+def test_visit_after_back_drops_forward_entries():
+    history = NavigationHistory(10)
+    for location in "abcd":
+        history.visit(location)
+    history.back()
+    history.back()
+    history.visit("x")
+    assert history.peek_forward() is None
+    assert history.back() == "b"
+    assert history.back() == "a"
+
+def test_back_and_forward_across_wrap():
+    history = NavigationHistory(4)
+    for location in range(10):
+        history.visit(location)
+    assert [history.back() for _ in range(3)] == [8, 7, 6]
+    assert history.peek_forward() == 7
+    history.visit(7)
+    history.visit(8)
+    history.visit(9)
+    assert history.peek_forward() is None
+    history.visit(10)
+    assert [history.back() for _ in range(3)] == [9, 8, 7]
+
+def test_zero_capacity_records_nothing():
+    history = NavigationHistory(0)
+    history.visit("a")
+    history.visit("b")
+    assert not history.can_back()
+    assert history.peek_forward() is None
@@ -0,0 +1,52 @@
+import os
+from library import Library
+
+def write_book(path, count):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(f"word{i} n.词{i}\n" for i in range(count)), encoding="utf-8")
+
+def make_library(tmp_path, counts):
+    resources = tmp_path / "resources"
+    for name, count in counts.items():
+        write_book(resources / name, count)
+    library = Library(str(tmp_path / "library.json"))
+    library.scan(str(resources))
+    return library
+
+def test_locate_and_offset_round_trip_skips_empty_books(tmp_path):
+    library = make_library(tmp_path, {"a.txt": 3, "b.txt": 0, "c.txt": 2, "sub/d.txt": 0, "sub/e.txt": 4})
+    assert [library.get_name(i) for i in range(len(library.files))] == [
+        "a.txt", "b.txt", "c.txt", os.path.join("sub", "d.txt"), os.path.join("sub", "e.txt")]
+    assert library.total == 9
+    assert list(library.offsets) == [0, 3, 3, 5, 5, 9]
+    for global_index in range(library.total):
+        book_index, line = library.locate(global_index)
+        assert library.book_count(book_index) > 0
+        assert 0 <= line < library.book_count(book_index)
+        assert library.offset(book_index) + line == global_index
+    assert library.locate(3) == (2, 0)
+    assert library.locate(5) == (4, 0)
+
+def test_locate_clamps_out_of_range(tmp_path):
+    library = make_library(tmp_path, {"a.txt": 2, "b.txt": 3})
+    assert library.locate(-1) == (0, 0)
+    assert library.locate(100) == (1, 2)
+
+def test_locate_without_words(tmp_path):
+    library = make_library(tmp_path, {"a.txt": 0})
+    assert library.total == 0
+    assert library.locate(0) == (0, 0)
+
+def test_rescan_only_updates_changed_books(tmp_path):
+    library = make_library(tmp_path, {"a.txt": 2, "b.txt": 3})
+    write_book(tmp_path / "resources" / "a.txt", 5)
+    library.scan(str(tmp_path / "resources"))
+    assert list(library.offsets) == [0, 5, 8]
+    assert library.locate(5) == (1, 0)
+
+def test_progress_of_unopened_book_is_zero(tmp_path):
+    library = make_library(tmp_path, {"a.txt": 1, "b.txt": 4})
+    assert library.get_progress(0) == 0.0
+    library.mark_opened(1)
+    library.set_position(1, 1)
+    assert library.get_progress(1) == 0.5
@@ -0,0 +1,41 @@
+import random
+from weighted_sampling import AliasTable, WeightedSampler
+
+def frequencies(sampler, samples, seed=1):
+    rng = random.Random(seed)
+    counts = [0] * len(sampler)
+    for _ in range(samples):
+        counts[sampler.sample(rng)] += 1
+    return [count / samples for count in counts]
+
+def assert_close(actual, weights, tolerance=0.01):
+    total = sum(weights)
+    for freq, weight in zip(actual, weights):
+        assert abs(freq - weight / total) < tolerance
+
+def test_alias_table_frequencies():
+    weights = [1.0, 2.0, 3.0, 4.0]
+    table = AliasTable(weights)
+    rng = random.Random(0)
+    counts = [0] * 4
+    for _ in range(100000):
+        counts[table.sample(rng)] += 1
+    assert_close([count / 100000 for count in counts], weights)
+
+def test_frequencies_follow_set_weight():
+    # 小块使单个修改只让所在块失效，同时覆盖块间表
+    weights = [1.0] * 10
+    sampler = WeightedSampler(weights, block_size=3)
+    frequencies(sampler, 1000)  # 先构建别名表，再修改
+    sampler.set_weight(4, 4.0)
+    sampler.set_weight(9, 0.0)
+    weights[4] = 4.0
+    weights[9] = 0.0
+    freqs = frequencies(sampler, 200000)
+    assert freqs[9] == 0
+    assert_close(freqs, weights)
+
+def test_zero_weights_sample_uniformly():
+    sampler = WeightedSampler([0.0, 0.0], block_size=1)
+    assert all(abs(freq - 0.5) < 0.05 for freq in frequencies(sampler, 10000))
+    assert WeightedSampler([]).sample() == -1